@@ -1,11 +1,17 @@
 """Initialize evaluation package."""
 
 from .evaluator import PropertyMatchEvaluator
+from .batch_evaluator import BatchJudgeRunner
+from .judge_cache import JudgeCache
+from .semantic_cache import SemanticJudgeCache
 from .metrics import MetricsCalculator, PerformanceMetrics
 from .test_queries import get_test_queries, get_query_by_index
 
 __all__ = [
     "PropertyMatchEvaluator",
+    "BatchJudgeRunner",
+    "JudgeCache",
+    "SemanticJudgeCache",
     "MetricsCalculator", 
     "PerformanceMetrics",
     "get_test_queries",
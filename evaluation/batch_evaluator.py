@@ -0,0 +1,117 @@
+"""OpenAI Batch API runner for offline LLM-judge evaluations."""
+
+import io
+import json
+import time
+from typing import List, Dict, Any, Optional
+from openai import OpenAI
+from loguru import logger
+
+from .evaluator import PropertyMatchEvaluator, get_shared_client
+
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+
+
+class BatchJudgeRunner:
+    """Submit judge prompts as a single Batch API job and route responses back by custom_id."""
+
+    def __init__(
+        self,
+        evaluator: PropertyMatchEvaluator,
+        poll_interval_s: float = 30.0,
+        completion_window: str = "24h",
+        client: Optional[OpenAI] = None
+    ):
+        """Initialize runner reusing the evaluator's model and response parser."""
+        self.client = client or get_shared_client()
+        self.evaluator = evaluator
+        self.poll_interval_s = poll_interval_s
+        self.completion_window = completion_window
+
+    def submit_batch(self, prompts: Dict[str, List[Dict[str, str]]]) -> str:
+        """
+        Upload judge prompts as a JSONL batch file and create the batch job.
+
+        Args:
+            prompts: Chat messages keyed by custom_id (e.g. "<config>|<query_idx>")
+
+        Returns:
+            The created batch ID
+        """
+        lines = []
+        for custom_id, messages in prompts.items():
+            lines.append(json.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": BATCH_ENDPOINT,
+                "body": {
+                    "model": self.evaluator.model,
+                    "messages": messages,
+                    "max_tokens": 500
+                }
+            }))
+
+        payload = io.BytesIO("\n".join(lines).encode("utf-8"))
+        batch_file = self.client.files.create(
+            file=("judge_batch.jsonl", payload),
+            purpose="batch"
+        )
+
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window=self.completion_window
+        )
+
+        logger.info(f"Submitted judge batch {batch.id} with {len(lines)} requests")
+        return batch.id
+
+    def wait_for_batch(self, batch_id: str):
+        """Poll a batch until it reaches a terminal status."""
+        while True:
+            batch = self.client.batches.retrieve(batch_id)
+            if batch.status == "completed":
+                return batch
+            if batch.status in ("failed", "expired", "cancelled"):
+                raise RuntimeError(f"Batch {batch_id} ended with status '{batch.status}'")
+
+            logger.info(f"Batch {batch_id} status: {batch.status} ({batch.request_counts})")
+            time.sleep(self.poll_interval_s)
+
+    def collect_results(self, batch) -> Dict[str, Dict[str, Any]]:
+        """Download batch output and parse each judge response, keyed by custom_id."""
+        results = {}
+        if not batch.output_file_id:
+            return results
+
+        content = self.client.files.content(batch.output_file_id).text
+        for line in content.splitlines():
+            if not line.strip():
+                continue
+
+            record = json.loads(line)
+            custom_id = record["custom_id"]
+            response = record.get("response") or {}
+
+            if record.get("error") or response.get("status_code") != 200:
+                error = record.get("error") or response.get("body", {}).get("error")
+                results[custom_id] = {
+                    "accuracy": 0.0,
+                    "is_correct": False,
+                    "error": str(error)
+                }
+                continue
+
+            evaluation_text = response["body"]["choices"][0]["message"]["content"]
+            evaluation_result = self.evaluator._parse_evaluation(evaluation_text)
+            evaluation_result["evaluation_text"] = evaluation_text
+            results[custom_id] = evaluation_result
+
+        return results
+
+    def run(self, prompts: Dict[str, List[Dict[str, str]]]) -> Dict[str, Dict[str, Any]]:
+        """Submit prompts, wait for completion and return parsed evaluations."""
+        batch_id = self.submit_batch(prompts)
+        batch = self.wait_for_batch(batch_id)
+        return self.collect_results(batch)
@@ -1,19 +1,60 @@
 """LLM-as-a-judge evaluator for agent performance assessment."""
 
-from typing import List, Dict, Any, Optional
-from openai import OpenAI
+from typing import List, Dict, Any, Optional, Tuple
+import httpx
+from openai import OpenAI, AsyncOpenAI
 from loguru import logger
 
-from config import settings
+from src.real_estate_agent.config import settings
+from .judge_cache import JudgeCache
+from .semantic_cache import SemanticJudgeCache
+
+
+# Process-wide clients so every evaluator shares one warm connection pool
+_HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=32)
+_shared_client: Optional[OpenAI] = None
+_shared_async_client: Optional[AsyncOpenAI] = None
+
+
+def get_shared_client() -> OpenAI:
+    """Return the process-wide synchronous OpenAI client."""
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = OpenAI(
+            api_key=settings.openai_api_key,
+            http_client=httpx.Client(limits=_HTTP_LIMITS)
+        )
+    return _shared_client
+
+
+def get_shared_async_client() -> AsyncOpenAI:
+    """Return the process-wide asynchronous OpenAI client."""
+    global _shared_async_client
+    if _shared_async_client is None:
+        _shared_async_client = AsyncOpenAI(
+            api_key=settings.openai_api_key,
+            http_client=httpx.AsyncClient(limits=_HTTP_LIMITS)
+        )
+    return _shared_async_client
 
 
 class PropertyMatchEvaluator:
     """LLM judge to evaluate if agent results match expected properties."""
     
-    def __init__(self, model: str = "gpt-4o"):
-        """Initialize evaluator with specified model."""
-        self.client = OpenAI(api_key=settings.openai_api_key)
+    def __init__(
+        self,
+        model: str = "gpt-4o",
+        cache: Optional[JudgeCache] = None,
+        client: Optional[AsyncOpenAI] = None,
+        semantic_cache: Optional[SemanticJudgeCache] = None,
+        sync_client: Optional[OpenAI] = None
+    ):
+        """Initialize evaluator with specified model, optional response caches and clients."""
+        self.client = client or get_shared_async_client()
+        self.sync_client = sync_client or get_shared_client()
         self.model = model
+        self.cache = cache
+        self.semantic_cache = semantic_cache
         
     def evaluate_search_results(
         self, 
@@ -21,6 +62,51 @@ class PropertyMatchEvaluator:
         agent_results: List[Dict[str, Any]], 
         expected_property_ids: List[str],
         expected_properties_data: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Blocking variant of `evaluate_search_results_async`, judged with the sync client.
+        
+        The shared async client's connections belong to the event loop that opened them,
+        so this does not wrap the async path in `asyncio.run`. The semantic cache is
+        async-only and is not consulted here.
+        """
+        try:
+            returned_property_ids, messages = self.build_judge_request(
+                query=query,
+                agent_results=agent_results,
+                expected_property_ids=expected_property_ids,
+                expected_properties_data=expected_properties_data
+            )
+            
+            cache_key, cached_result = self._cache_lookup(messages)
+            if cached_result is not None:
+                return cached_result
+            
+            response = self.sync_client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                max_tokens=500
+            )
+            
+            return self._record_evaluation(
+                query, returned_property_ids, expected_property_ids,
+                response.choices[0].message.content, cache_key
+            )
+            
+        except Exception as e:
+            logger.error(f"Error in evaluation: {str(e)}")
+            return {
+                "accuracy": 0.0,
+                "is_correct": False,
+                "error": str(e)
+            }
+    
+    async def evaluate_search_results_async(
+        self, 
+        query: str,
+        agent_results: List[Dict[str, Any]], 
+        expected_property_ids: List[str],
+        expected_properties_data: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
         """
         Evaluate if agent search results match expected properties.
@@ -35,43 +121,41 @@ class PropertyMatchEvaluator:
             Dict with evaluation results including accuracy score
         """
         try:
-            # Extract property IDs from agent results
-            returned_property_ids = []
-            for result in agent_results:
-                if isinstance(result, dict) and 'property_id' in result:
-                    returned_property_ids.append(result['property_id'])
-                elif isinstance(result, dict) and 'metadata' in result:
-                    returned_property_ids.append(result['metadata'].get('property_id', 'Unknown'))
-            
-            # Create evaluation prompt
-            prompt = self._create_evaluation_prompt(
+            returned_property_ids, messages = self.build_judge_request(
                 query=query,
-                returned_property_ids=returned_property_ids,
+                agent_results=agent_results,
                 expected_property_ids=expected_property_ids,
-                expected_properties_data=expected_properties_data,
-                agent_results=agent_results
+                expected_properties_data=expected_properties_data
             )
             
+            cache_key, cached_result = self._cache_lookup(messages)
+            if cached_result is not None:
+                return cached_result
+            
+            # Paraphrased queries with identical results can reuse an earlier verdict
+            if self.semantic_cache is not None:
+                semantic_result = await self._semantic_lookup(query, returned_property_ids, expected_property_ids)
+                if semantic_result is not None:
+                    semantic_result.update({
+                        "query": query,
+                        "returned_property_ids": returned_property_ids,
+                        "expected_property_ids": expected_property_ids
+                    })
+                    return semantic_result
+            
             # Get LLM judgment
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model=self.model,
-                messages=[
-                    {"role": "system", "content": self._get_system_prompt()},
-                    {"role": "user", "content": prompt}
-                ],
+                messages=messages,
                 max_tokens=500
             )
             
-            evaluation_text = response.choices[0].message.content
-            
-            # Parse evaluation results
-            evaluation_result = self._parse_evaluation(evaluation_text)
-            evaluation_result.update({
-                "query": query,
-                "returned_property_ids": returned_property_ids,
-                "expected_property_ids": expected_property_ids,
-                "evaluation_text": evaluation_text
-            })
+            evaluation_result = self._record_evaluation(
+                query, returned_property_ids, expected_property_ids,
+                response.choices[0].message.content, cache_key
+            )
+            if self.semantic_cache is not None:
+                await self._semantic_store(query, returned_property_ids, expected_property_ids, evaluation_result)
             
             return evaluation_result
             
@@ -83,6 +167,90 @@ class PropertyMatchEvaluator:
                 "error": str(e)
             }
     
+    def _cache_lookup(self, messages: List[Dict[str, str]]) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """Return (cache key, cached evaluation); identical prompts yield identical judgments."""
+        if self.cache is None:
+            return None, None
+        cache_key = self.cache.make_key(self.model, messages)
+        return cache_key, self.cache.get(cache_key)
+    
+    def _record_evaluation(
+        self,
+        query: str,
+        returned_property_ids: List[str],
+        expected_property_ids: List[str],
+        evaluation_text: str,
+        cache_key: Optional[str]
+    ) -> Dict[str, Any]:
+        """Parse a judge response into an evaluation result and store it in the exact cache."""
+        evaluation_result = self._parse_evaluation(evaluation_text)
+        evaluation_result.update({
+            "query": query,
+            "returned_property_ids": returned_property_ids,
+            "expected_property_ids": expected_property_ids,
+            "evaluation_text": evaluation_text
+        })
+        
+        if cache_key is not None:
+            self.cache.set(cache_key, evaluation_result)
+        return evaluation_result
+    
+    async def _semantic_lookup(
+        self,
+        query: str,
+        returned_property_ids: List[str],
+        expected_property_ids: List[str]
+    ) -> Optional[Dict[str, Any]]:
+        """Look up the semantic cache; cache failures never fail the evaluation."""
+        try:
+            return await self.semantic_cache.lookup(query, returned_property_ids, expected_property_ids)
+        except Exception as e:
+            logger.warning(f"Semantic cache lookup failed: {str(e)}")
+            return None
+    
+    async def _semantic_store(
+        self,
+        query: str,
+        returned_property_ids: List[str],
+        expected_property_ids: List[str],
+        evaluation_result: Dict[str, Any]
+    ):
+        """Store a verdict in the semantic cache; cache failures never fail the evaluation."""
+        try:
+            await self.semantic_cache.store(query, returned_property_ids, expected_property_ids, evaluation_result)
+        except Exception as e:
+            logger.warning(f"Semantic cache store failed: {str(e)}")
+    
+    def build_judge_request(
+        self,
+        query: str,
+        agent_results: List[Dict[str, Any]],
+        expected_property_ids: List[str],
+        expected_properties_data: List[Dict[str, Any]]
+    ) -> Tuple[List[str], List[Dict[str, str]]]:
+        """Build the judge chat messages, returning them with the extracted property IDs."""
+        # Extract property IDs from agent results
+        returned_property_ids = [
+            result['property_id'] if 'property_id' in result
+            else result['metadata'].get('property_id', 'Unknown')
+            for result in agent_results
+            if isinstance(result, dict) and ('property_id' in result or 'metadata' in result)
+        ]
+        
+        # Create evaluation prompt
+        prompt = self._create_evaluation_prompt(
+            query=query,
+            expected_property_ids=expected_property_ids,
+            expected_properties_data=expected_properties_data,
+            agent_results=agent_results
+        )
+        
+        messages = [
+            {"role": "system", "content": self._get_system_prompt()},
+            {"role": "user", "content": prompt}
+        ]
+        return returned_property_ids, messages
+    
     def _get_system_prompt(self) -> str:
         """System prompt for LLM judge."""
         return """You are an expert real estate evaluator. Your job is to assess whether a property search agent returned the correct properties for a given query.
@@ -102,12 +270,14 @@ Be strict but fair in your evaluation."""
     def _create_evaluation_prompt(
         self,
         query: str,
-        returned_property_ids: List[str],
         expected_property_ids: List[str], 
         expected_properties_data: List[Dict[str, Any]],
         agent_results: List[Dict[str, Any]]
     ) -> str:
-        """Create evaluation prompt for LLM judge."""
+        """Create evaluation prompt for LLM judge.
+        
+        Property IDs already appear in the formatted blocks, so they are not repeated.
+        """
         
         prompt = f"""
 USER QUERY: "{query}"
@@ -118,9 +288,6 @@ EXPECTED PROPERTIES (Ground Truth):
 AGENT RETURNED PROPERTIES:
 {self._format_agent_results(agent_results)}
 
-RETURNED PROPERTY IDS: {returned_property_ids}
-EXPECTED PROPERTY IDS: {expected_property_ids}
-
 Please evaluate if the agent's results correctly match the user's query requirements.
 """
         return prompt
@@ -142,23 +309,15 @@ Please evaluate if the agent's results correctly match the user's query requirem
         if not agent_results:
             return "No properties returned"
         
-        formatted = []
-        for result in agent_results[:5]:  # Limit to first 5 for brevity
-            if isinstance(result, dict):
-                property_id = result.get('property_id', 'Unknown')
-                title = result.get('title', 'Unknown')
-                price = result.get('price', 'Unknown')
-                bedrooms = result.get('bedrooms', 'Unknown')
-                bathrooms = result.get('bathrooms', 'Unknown')
-                city = result.get('city', 'Unknown')
-                state = result.get('state', 'Unknown')
-                
-                formatted.append(
-                    f"- {property_id}: {title} "
-                    f"({price}, {bedrooms}BR/{bathrooms}BA, {city}, {state})"
-                )
-        
-        return "\n".join(formatted)
+        # Vector search hits nest their fields under 'metadata'; limit to first 5 for brevity
+        formatted = "\n".join(
+            f"- {data.get('property_id', 'Unknown')}: {data.get('title', 'Unknown')} "
+            f"({data.get('price', 'Unknown')}, {data.get('bedrooms', 'Unknown')}BR/"
+            f"{data.get('bathrooms', 'Unknown')}BA, {data.get('city', 'Unknown')}, "
+            f"{data.get('state', 'Unknown')})"
+            for data in (result.get('metadata', result) for result in agent_results[:5] if isinstance(result, dict))
+        )
+        return formatted or "No properties returned"
     
     def _parse_evaluation(self, evaluation_text: str) -> Dict[str, Any]:
         """Parse LLM evaluation response."""
@@ -0,0 +1,52 @@
+"""On-disk cache for deterministic LLM-judge responses."""
+
+import hashlib
+import json
+import shelve
+from typing import List, Dict, Any, Optional
+
+
+class JudgeCache:
+    """File-backed cache of judge evaluations keyed by SHA-256 of (model, prompt)."""
+
+    def __init__(self, path: str = "evaluation/.judge_cache"):
+        """Open (or create) the shelve database at the given path."""
+        self.path = path
+        self._db = shelve.open(path)
+        self.stats = {"hits": 0, "misses": 0}
+
+    @staticmethod
+    def make_key(model: str, messages: List[Dict[str, str]]) -> str:
+        """Build a stable cache key from the judge model and chat messages."""
+        payload = json.dumps({"m": model, "messages": messages}, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a cached evaluation, or None on a miss."""
+        value = self._db.get(key)
+        if value is None:
+            self.stats["misses"] += 1
+            return None
+
+        self.stats["hits"] += 1
+        return dict(value)
+
+    def set(self, key: str, value: Dict[str, Any]):
+        """Store an evaluation result."""
+        self._db[key] = dict(value)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.stats["hits"] + self.stats["misses"]
+        return self.stats["hits"] / total if total else 0.0
+
+    def close(self):
+        """Flush and close the underlying database."""
+        self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
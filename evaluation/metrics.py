@@ -1,11 +1,20 @@
 """Metrics calculation for performance evaluation."""
 
+import sys
+import json
 import time
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, TextIO
 from dataclasses import dataclass
 
+import numpy as np
 
-@dataclass
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to stdlib json
+    orjson = None
+
+
+@dataclass(slots=True, frozen=True)
 class PerformanceMetrics:
     """Container for performance evaluation metrics."""
     accuracy: float
@@ -40,68 +49,100 @@ class MetricsCalculator:
     
     def measure_latency(self, func, *args, **kwargs) -> tuple:
         """Measure function execution time in milliseconds."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         result = func(*args, **kwargs)
-        end_time = time.time()
+        end_time = time.perf_counter()
         
         latency_ms = (end_time - start_time) * 1000
         return result, latency_ms
     
+    def calculate_latency_percentiles(self, latencies) -> Dict[str, float]:
+        """Calculate median and p95 latency, since averages hide tail latency."""
+        if len(latencies) == 0:
+            return {"median_latency_ms": 0.0, "p95_latency_ms": 0.0}
+        
+        median, p95 = np.percentile(latencies, [50, 95])
+        return {
+            "median_latency_ms": float(median),
+            "p95_latency_ms": float(p95)
+        }
+    
     def compile_results(self, configuration_results: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Dict[str, float]]:
         """Compile results across all configurations."""
         summary = {}
         
         for config_name, evaluations in configuration_results.items():
             if evaluations:
+                count = len(evaluations)
+                accuracies = np.fromiter(
+                    (e.get('accuracy', 0.0) for e in evaluations), dtype=np.float64, count=count
+                )
+                correct = np.fromiter(
+                    (1.0 if e.get('is_correct', False) else 0.0 for e in evaluations), dtype=np.float64, count=count
+                )
+                latencies = np.fromiter(
+                    (e.get('latency_ms', 0.0) for e in evaluations), dtype=np.float64, count=count
+                )
                 summary[config_name] = {
-                    "accuracy": self.calculate_accuracy(evaluations),
-                    "correctness_rate": self.calculate_correctness_rate(evaluations),
-                    "avg_latency_ms": sum(eval_result.get('latency_ms', 0) for eval_result in evaluations) / len(evaluations),
-                    "total_queries": len(evaluations)
+                    "accuracy": float(accuracies.mean()),
+                    "correctness_rate": float(correct.mean()),
+                    "avg_latency_ms": float(latencies.mean()),
+                    **self.calculate_latency_percentiles(latencies),
+                    "total_queries": count
                 }
             else:
                 summary[config_name] = {
                     "accuracy": 0.0,
                     "correctness_rate": 0.0,
                     "avg_latency_ms": 0.0,
+                    "median_latency_ms": 0.0,
+                    "p95_latency_ms": 0.0,
                     "total_queries": 0
                 }
         
         return summary
     
-    def print_comparison_report(self, summary: Dict[str, Dict[str, float]]):
-        """Print formatted comparison report."""
-        print("\n" + "="*80)
-        print("PERFORMANCE COMPARISON REPORT")
-        print("="*80)
-        
-        # Header
-        print(f"{'Configuration':<30} {'Accuracy':<12} {'Correct %':<12} {'Latency (ms)':<15}")
-        print("-" * 80)
+    def print_comparison_report(self, summary: Dict[str, Dict[str, float]], file: Optional[TextIO] = None):
+        """Print formatted comparison report with a single write."""
+        lines = [
+            "",
+            "="*96,
+            "PERFORMANCE COMPARISON REPORT",
+            "="*96,
+            # Header
+            f"{'Configuration':<42} {'Accuracy':<10} {'Correct %':<11} {'Avg (ms)':<10} {'P50 (ms)':<10} {'P95 (ms)':<10}",
+            "-" * 96,
+        ]
         
         # Results
         for config_name, metrics in summary.items():
             accuracy = metrics['accuracy']
             correctness = metrics['correctness_rate'] * 100
             latency = metrics['avg_latency_ms']
+            median_latency = metrics.get('median_latency_ms', 0.0)
+            p95_latency = metrics.get('p95_latency_ms', 0.0)
             
-            print(f"{config_name:<30} {accuracy:<12.3f} {correctness:<12.1f} {latency:<15.1f}")
+            lines.append(f"{config_name:<42} {accuracy:<10.3f} {correctness:<11.1f} {latency:<10.1f} {median_latency:<10.1f} {p95_latency:<10.1f}")
         
-        print("="*80)
+        lines.append("="*96)
         
         # Best performers
         best_accuracy = max(summary.items(), key=lambda x: x[1]['accuracy'])
         best_latency = min(summary.items(), key=lambda x: x[1]['avg_latency_ms'])
         
-        print(f"\nBest Accuracy: {best_accuracy[0]} ({best_accuracy[1]['accuracy']:.3f})")
-        print(f"Best Latency: {best_latency[0]} ({best_latency[1]['avg_latency_ms']:.1f}ms)")
+        lines.append(f"\nBest Accuracy: {best_accuracy[0]} ({best_accuracy[1]['accuracy']:.3f})")
+        lines.append(f"Best Latency: {best_latency[0]} ({best_latency[1]['avg_latency_ms']:.1f}ms)")
+        
+        (file or sys.stdout).write("\n".join(lines) + "\n")
     
     def export_results_to_json(self, summary: Dict[str, Dict[str, float]], filename: str):
         """Export results to JSON file."""
-        import json
-        
-        with open(filename, 'w') as f:
-            json.dump(summary, f, indent=2)
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(summary, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(summary, f, indent=2, sort_keys=True)
         
         print(f"\nResults exported to {filename}")
 
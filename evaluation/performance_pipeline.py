@@ -1,23 +1,28 @@
-"""Performance evaluation pipeline with A/B/C testing configurations."""
+"""Performance evaluation pipeline with A/B/C testing configurations.
+
+Run from the repository root: python -m evaluation.performance_pipeline [--batch] [--semantic-cache]
+"""
 
 import sys
-import os
 import re
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-import json
-from typing import Dict, Any, List
+import asyncio
+import threading
+from collections import defaultdict
+from concurrent.futures import Future
+from functools import partial
+from itertools import islice
+from typing import Dict, Any, List, Optional, Tuple, TYPE_CHECKING
 from dataclasses import dataclass
 from loguru import logger
 
-from src.real_estate_agent.schemas import PropertyListing
-from scripts.sample_data_ingestion import create_sample_properties
 from evaluation.test_queries import get_test_queries
-from evaluation.evaluator import PropertyMatchEvaluator
 from evaluation.metrics import metrics_calculator
 
+if TYPE_CHECKING:
+    from src.real_estate_agent.schemas import Amenity, PropertyListing
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class TestConfiguration:
     """Configuration for A/B/C testing."""
     name: str
@@ -27,6 +32,22 @@ class TestConfiguration:
     description: str
 
 
+# Agent response block: a title line optionally followed (before the next title) by a details line
+# "- Title (Neighborhood, City, State) — $Price"
+# "X bed | Y bath | Z sq ft | Type | Year | $/sq ft | Days on market"
+_BLOCK_RE = re.compile(r'''
+    ^[ \t]*-[ \t]*(?P<title>.+?)[ \t]*
+    \((?P<neighborhood>.+?),[ \t]*(?P<city>.+?),[ \t]*(?P<state>.+?)\)[ \t]*—[ \t]*
+    \$(?P<price>[\d,]+(?:\.\d+)?)[^\n]*
+    (?:
+        (?:\n(?![ \t]*-[^\n]*—[ \t]*\$)[^\n]*)*?
+        \n[ \t]*(?P<bedrooms>\d+)[ \t]*bed[ \t]*\|[ \t]*(?P<bathrooms>\d+(?:\.\d+)?)[ \t]*bath[ \t]*\|
+        [^|\n]+\|[ \t]*(?P<property_type>\w+)[ \t]*\|
+    )?
+''', re.M | re.X)
+_TOKEN_RE = re.compile(r'\w+')
+
+
 # 8 test configurations (2^3 combinations)
 TEST_CONFIGURATIONS = [
     TestConfiguration("NoVectors_NoSearchable_NoAmenities", False, False, False, 
@@ -51,91 +72,297 @@ TEST_CONFIGURATIONS = [
 class PerformancePipeline:
     """Pipeline for running comprehensive A/B/C testing."""
     
-    def __init__(self):
-        self.evaluator = PropertyMatchEvaluator()
+    def __init__(self, num_concurrent: int = 10, use_semantic_cache: bool = False):
+        # Deferred: these pull in the OpenAI/Pinecone clients, which only a running pipeline needs
+        from src.real_estate_agent.catalog import PropertyCatalog
+        from src.real_estate_agent.sample_data import create_sample_properties
+        from src.real_estate_agent.schemas import Amenity, SearchQuery
+        from evaluation.evaluator import PropertyMatchEvaluator, get_shared_async_client
+        from evaluation.judge_cache import JudgeCache
+        from evaluation.semantic_cache import SemanticJudgeCache
+        
+        # The semantic cache costs an embedding call per judge miss and may reuse a verdict
+        # from a near-identical query, so it is opt-in
+        self.evaluator = PropertyMatchEvaluator(
+            cache=JudgeCache(),
+            semantic_cache=SemanticJudgeCache(client=get_shared_async_client()) if use_semantic_cache else None
+        )
         self.sample_properties = create_sample_properties()
         self.test_queries = get_test_queries()
         
-    def run_full_evaluation(self) -> Dict[str, Dict[str, float]]:
-        """Run evaluation across all 8 configurations."""
-        logger.info("Starting comprehensive A/B/C testing pipeline")
+        # Lookup indexes over the sample data
+        self._by_id = {p.metadata.property_id: p for p in self.sample_properties}
+        self._by_tcp = {
+            (p.title.lower(), p.metadata.city.lower(), p.metadata.price): p.metadata.property_id
+            for p in self.sample_properties
+        }
         
-        all_results = {}
+        # Inverted index of title/description tokens for metadata-only search
+        self._inv_index: Dict[str, set] = defaultdict(set)
+        for idx, p in enumerate(self.sample_properties):
+            for token in _TOKEN_RE.findall(f"{p.title} {p.description}".lower()):
+                self._inv_index[token].add(idx)
         
-        for config in TEST_CONFIGURATIONS:
-            logger.info(f"Testing configuration: {config.name}")
-            config_results = self._test_configuration(config)
-            all_results[config.name] = config_results
+        # Columnar view for vectorized amenity filtering, plus whole-word patterns for amenity
+        # names as queries phrase them ("pool" matches "pools" but not "carpool")
+        self._catalog = PropertyCatalog(self.sample_properties)
+        self._amenity_patterns = [
+            (re.compile(r"\b" + re.escape(amenity.value.replace("_", " ")) + r"s?\b"), amenity)
+            for amenity in Amenity
+        ]
+        self._search_query_cls = SearchQuery
         
+        # Expected property data is fixed per query, so project it once for all configurations
+        self._expected_data_by_query_idx = [
+            self._get_properties_by_ids(tc['expected_properties']) for tc in self.test_queries
+        ]
+        self.num_concurrent = num_concurrent  # Max in-flight judge calls across all configurations
+        
+        # (latency_ms, evaluation) tasks shared across configurations that run the same effective search
+        self._eval_tasks: Dict[tuple, asyncio.Task] = {}
+        
+        # Agent responses keyed by query (searchable content is not an agent knob yet),
+        # resolving to (response, original agent latency) so cache hits still report real search time
+        self._agent_cache: Dict[str, Future] = {}
+        self._agent_cache_lock = threading.Lock()
+        
+    def close(self):
+        """Flush and close the on-disk judge caches; the run methods call this when they finish."""
+        for cache in (self.evaluator.cache, self.evaluator.semantic_cache):
+            if cache is not None:
+                cache.close()
+    
+    def run_full_evaluation(self) -> Dict[str, Dict[str, float]]:
+        """Run evaluation across all 8 configurations (blocking)."""
+        return asyncio.run(self.run_full_evaluation_async())
+    
+    async def run_full_evaluation_async(self) -> Dict[str, Dict[str, float]]:
+        """Run evaluation across all 8 configurations."""
+        try:
+            logger.info("Starting comprehensive A/B/C testing pipeline")
+            
+            self._eval_tasks.clear()
+            
+            # Configurations are independent; one semaphore keeps the total judge load within rate limits
+            sem = asyncio.Semaphore(self.num_concurrent)
+            results = await asyncio.gather(
+                *(self._test_configuration_async(config, sem) for config in TEST_CONFIGURATIONS)
+            )
+            all_results = dict(zip((config.name for config in TEST_CONFIGURATIONS), results))
+            
+            cache = self.evaluator.cache
+            if cache is not None:
+                logger.info(
+                    f"Judge cache: {cache.stats['hits']} hits, {cache.stats['misses']} misses "
+                    f"({cache.hit_rate:.1%} hit rate)"
+                )
+            semantic_cache = self.evaluator.semantic_cache
+            if semantic_cache is not None:
+                logger.info(
+                    f"Semantic judge cache: {semantic_cache.stats['hits']} hits, "
+                    f"{semantic_cache.stats['misses']} misses"
+                )
+            
+            return self._summarize(all_results)
+        finally:
+            self.close()
+    
+    def run_full_evaluation_batch(self) -> Dict[str, Dict[str, float]]:
+        """Run evaluation across all 8 configurations, judging everything in one Batch API job."""
+        try:
+            logger.info("Starting comprehensive A/B/C testing pipeline (batch judge mode)")
+            
+            all_results = {config.name: [] for config in TEST_CONFIGURATIONS}
+            prompts = {}
+            pending = {}
+            canonical_ids = {}  # (effective_key, query) -> custom_id of the first equivalent request
+            
+            for config in TEST_CONFIGURATIONS:
+                logger.info(f"Searching with configuration: {config.name}")
+                search_func = self._create_search_function(config)
+                effective_key = self._effective_search_key(config)
+                
+                for query_idx, test_case in enumerate(self.test_queries):
+                    query = test_case['query']
+                    expected_ids = test_case['expected_properties']
+                    custom_id = f"{config.name}|{query_idx}"
+                    
+                    canonical_id = canonical_ids.get((effective_key, query))
+                    if canonical_id is not None:
+                        # Same search as an earlier configuration: reuse its judge request
+                        pending[custom_id] = dict(pending[canonical_id], configuration=config.name)
+                        pending[custom_id]["judge_id"] = canonical_id
+                        continue
+                    
+                    try:
+                        search_results, latency_ms = search_func(query)
+                        returned_ids, messages = self.evaluator.build_judge_request(
+                            query=query,
+                            agent_results=search_results,
+                            expected_property_ids=expected_ids,
+                            expected_properties_data=self._expected_data_by_query_idx[query_idx]
+                        )
+                    except Exception as e:
+                        logger.error(f"Error testing query '{query}': {str(e)}")
+                        all_results[config.name].append({
+                            "accuracy": 0.0,
+                            "is_correct": False,
+                            "latency_ms": 0.0,
+                            "error": str(e),
+                            "configuration": config.name
+                        })
+                        continue
+                    
+                    prompts[custom_id] = messages
+                    canonical_ids[(effective_key, query)] = custom_id
+                    pending[custom_id] = {
+                        "query": query,
+                        "returned_property_ids": returned_ids,
+                        "expected_property_ids": expected_ids,
+                        "latency_ms": latency_ms,
+                        "configuration": config.name,
+                        "judge_id": custom_id
+                    }
+            
+            from evaluation.batch_evaluator import BatchJudgeRunner
+            
+            judged = BatchJudgeRunner(self.evaluator).run(prompts) if prompts else {}
+            
+            for custom_id, context in pending.items():
+                judge_id = context.pop("judge_id")
+                evaluation = dict(judged.get(judge_id, {
+                    "accuracy": 0.0,
+                    "is_correct": False,
+                    "error": "No batch response returned"
+                }))
+                evaluation.update(context)
+                all_results[context["configuration"]].append(evaluation)
+            
+            return self._summarize(all_results)
+        finally:
+            self.close()
+    
+    def _summarize(self, all_results: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Dict[str, float]]:
+        """Compile, print and export results for all configurations."""
         # Compile final results
         summary = metrics_calculator.compile_results(all_results)
         
-        # Print comparison report
+        # Print comparison report (and keep a copy next to the JSON export)
         metrics_calculator.print_comparison_report(summary)
+        with open("evaluation/results.txt", "w") as f:
+            metrics_calculator.print_comparison_report(summary, file=f)
         
         # Export to JSON
         metrics_calculator.export_results_to_json(summary, "evaluation/results.json")
         
         return summary
     
-    def _test_configuration(self, config: TestConfiguration) -> List[Dict[str, Any]]:
-        """Test a single configuration against all test queries."""
-        logger.info(f"Running tests for: {config.description}")
+    async def _test_configuration_async(
+        self,
+        config: TestConfiguration,
+        sem: asyncio.Semaphore
+    ) -> List[Dict[str, Any]]:
+        """Test a single configuration against all test queries concurrently."""
+        logger.info(f"Testing configuration: {config.name} ({config.description})")
         
-        configuration_results = []
+        tasks = [
+            self._evaluate_one_async(query_idx, test_case, config, sem)
+            for query_idx, test_case in enumerate(self.test_queries)
+        ]
+        outcomes = await asyncio.gather(*tasks, return_exceptions=True)
         
-        for test_case in self.test_queries:
-            query = test_case['query']
-            expected_ids = test_case['expected_properties']
-            
-            try:
-                # Setup configuration
-                search_func = self._create_search_function(config)
-                
-                # Measure search latency
-                search_results, latency_ms = metrics_calculator.measure_latency(
-                    search_func, query
-                )
-                
-                # Get expected property data
-                expected_properties_data = self._get_properties_by_ids(expected_ids)
-                
-                # Evaluate results
-                evaluation = self.evaluator.evaluate_search_results(
-                    query=query,
-                    agent_results=search_results,
-                    expected_property_ids=expected_ids,
-                    expected_properties_data=expected_properties_data
-                )
-                
-                # Add metrics
-                evaluation.update({
-                    "latency_ms": latency_ms,
-                    "configuration": config.name
-                })
-                
-                configuration_results.append(evaluation)
-                
-                logger.info(f"Query: '{query[:50]}...' - Accuracy: {evaluation.get('accuracy', 0):.3f}, Latency: {latency_ms:.1f}ms")
-                
-            except Exception as e:
-                logger.error(f"Error testing query '{query}': {str(e)}")
+        configuration_results = []
+        for test_case, outcome in zip(self.test_queries, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(f"Error testing query '{test_case['query']}': {str(outcome)}")
                 configuration_results.append({
                     "accuracy": 0.0,
                     "is_correct": False,
                     "latency_ms": 0.0,
-                    "error": str(e),
+                    "error": str(outcome),
                     "configuration": config.name
                 })
+            else:
+                configuration_results.append(outcome)
         
         return configuration_results
     
+    async def _evaluate_one_async(
+        self,
+        query_idx: int,
+        test_case: Dict[str, Any],
+        config: TestConfiguration,
+        sem: asyncio.Semaphore
+    ) -> Dict[str, Any]:
+        """Run one test query through a configuration and judge the results."""
+        query = test_case['query']
+        cache_key = (self._effective_search_key(config), query)
+        
+        # Equivalent configurations await the same search + judge task instead of repeating it
+        task = self._eval_tasks.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(self._search_and_judge_async(query_idx, test_case, config, sem))
+            self._eval_tasks[cache_key] = task
+        
+        latency_ms, evaluation = await task
+        evaluation = dict(evaluation)
+        
+        # Add metrics
+        evaluation.update({
+            "latency_ms": latency_ms,
+            "configuration": config.name
+        })
+        
+        logger.info(f"Query: '{query[:50]}...' - Accuracy: {evaluation.get('accuracy', 0):.3f}, Latency: {latency_ms:.1f}ms")
+        
+        return evaluation
+    
+    async def _search_and_judge_async(
+        self,
+        query_idx: int,
+        test_case: Dict[str, Any],
+        config: TestConfiguration,
+        sem: asyncio.Semaphore
+    ) -> Tuple[float, Dict[str, Any]]:
+        """Search with a configuration and judge the results, returning (latency_ms, evaluation)."""
+        query = test_case['query']
+        
+        # Setup configuration
+        search_func = self._create_search_function(config)
+        
+        async with sem:
+            # Searches block on the OpenAI/Pinecone clients, so they run in a worker thread;
+            # latency is measured inside the worker, excluding time spent waiting for the semaphore
+            search_results, latency_ms = await asyncio.to_thread(search_func, query)
+            
+            # Evaluate results
+            evaluation = await self.evaluator.evaluate_search_results_async(
+                query=query,
+                agent_results=search_results,
+                expected_property_ids=test_case['expected_properties'],
+                expected_properties_data=self._expected_data_by_query_idx[query_idx]
+            )
+        
+        return latency_ms, evaluation
+    
+    def _effective_search_key(self, config: TestConfiguration) -> tuple:
+        """Key configurations by the search they actually execute.
+        
+        Searchable content is not wired into either search path yet (both vector
+        configurations call the same agent search, and metadata-only search ignores
+        it), so it is collapsed out of the key.
+        """
+        return (config.use_vectors, config.use_amenities_filter)
+    
     def _create_search_function(self, config: TestConfiguration):
-        """Create search function based on configuration."""
+        """Create search function based on configuration; it returns (results, latency_ms)."""
         
         if not config.use_vectors:
             # Metadata filtering only (no vector search)
-            return self._metadata_only_search
+            return partial(
+                metrics_calculator.measure_latency, self._metadata_only_search,
+                use_amenities_filter=config.use_amenities_filter
+            )
         else:
             # Vector search with or without searchable content
             if config.use_searchable_content:
@@ -143,102 +370,82 @@ class PerformancePipeline:
             else:
                 return self._vector_search_description_only
     
-    def _metadata_only_search(self, query: str) -> List[Dict[str, Any]]:
+    def _metadata_only_search(self, query: str, use_amenities_filter: bool = False) -> List[Dict[str, Any]]:
         """Search using only metadata filters (no vectorization)."""
         logger.info("Using metadata-only search (no vectors)")
         
         # Simple keyword matching in title/description
         results = []
-        query_words = query.lower().split()
-        
-        for prop in self.sample_properties[:10]:  # Limit results
-            title_desc = f"{prop.title} {prop.description}".lower()
-            if any(word in title_desc for word in query_words):
-                results.append({
-                    'property_id': prop.metadata.property_id,
-                    'title': prop.title,
-                    'price': prop.metadata.price,
-                    'bedrooms': prop.metadata.bedrooms,
-                    'bathrooms': prop.metadata.bathrooms,
-                    'city': prop.metadata.city,
-                    'state': prop.metadata.state
-                })
+        hits = set().union(*(self._inv_index.get(word, ()) for word in _TOKEN_RE.findall(query.lower())))
+        
+        if use_amenities_filter:
+            # Keep listings that have every amenity the query names
+            allowed = self._catalog.filter(self._search_query_cls(query=query, required_amenities=self._amenities_in(query)))
+            hits = {idx for idx in hits if allowed[idx]}
+        
+        for idx in islice(sorted(hits), 10):  # Limit results
+            prop = self.sample_properties[idx]
+            results.append({
+                'property_id': prop.metadata.property_id,
+                'title': prop.title,
+                'price': prop.metadata.price,
+                'bedrooms': prop.metadata.bedrooms,
+                'bathrooms': prop.metadata.bathrooms,
+                'city': prop.metadata.city,
+                'state': prop.metadata.state
+            })
         
         return results
     
-    def _vector_search_with_searchable_content(self, query: str) -> List[Dict[str, Any]]:
-        """Search using vectors with searchable content."""
-        from src.real_estate_agent.agent import real_estate_agent
-        
+    def _amenities_in(self, query: str) -> List["Amenity"]:
+        """Amenities named in a query ("pool", "pet friendly", "hardwood floors")."""
+        lowered = query.lower()
+        return [amenity for pattern, amenity in self._amenity_patterns if pattern.search(lowered)]
+    
+    def _vector_search_with_searchable_content(self, query: str) -> Tuple[List[Dict[str, Any]], float]:
+        """Search using vectors with searchable content, returning (results, latency_ms)."""
         logger.info("Using vector search with searchable content (via RealEstateAgent)")
-        response_text = real_estate_agent.search_properties(query)
+        return self._timed_agent_search(query)
+    
+    def _vector_search_description_only(self, query: str) -> Tuple[List[Dict[str, Any]], float]:
+        """Search using vectors with description only (current implementation), returning (results, latency_ms)."""
+        logger.info("Using vector search with description only (via RealEstateAgent)")
+        return self._timed_agent_search(query)
+    
+    def _timed_agent_search(self, query: str) -> Tuple[List[Dict[str, Any]], float]:
+        """Run the (cached) agent search and parse its response, returning (results, latency_ms)."""
+        response_text, agent_latency_ms = self._cached_agent_search(query)
         
         # Parse agent response to extract structured property data
-        return self._parse_agent_response(response_text)
+        results, parse_latency_ms = metrics_calculator.measure_latency(self._parse_agent_response, response_text)
+        return results, agent_latency_ms + parse_latency_ms
     
-    def _vector_search_description_only(self, query: str) -> List[Dict[str, Any]]:
-        """Search using vectors with description only (current implementation)."""
-        from src.real_estate_agent.agent import real_estate_agent
+    def _cached_agent_search(self, query: str) -> Tuple[str, float]:
+        """Return (agent response, agent latency_ms) for a query, calling the agent only once per query.
         
-        logger.info("Using vector search with description only (via RealEstateAgent)")
-        response_text = real_estate_agent.search_properties(query)
+        Cache hits report the original agent latency. Searches run in worker threads,
+        so concurrent callers for one query wait on a shared future.
+        """
+        with self._agent_cache_lock:
+            future = self._agent_cache.get(query)
+            is_owner = future is None
+            if is_owner:
+                future = self._agent_cache[query] = Future()
         
-        # Parse agent response to extract structured property data
-        return self._parse_agent_response(response_text)
+        if is_owner:
+            from src.real_estate_agent.agent import real_estate_agent
+            
+            try:
+                future.set_result(metrics_calculator.measure_latency(real_estate_agent.search_properties, query))
+            except BaseException as e:
+                future.set_exception(e)
+        
+        return future.result()
     
     def _parse_agent_response(self, response_text: str) -> List[Dict[str, Any]]:
         """Parse agent text response to extract property data."""
-        properties = []
-        
         try:
-            # Look for property patterns in the agent response
-            # Pattern: "- Title (Neighborhood, City, State) — $Price"
-            # Followed by: "X bed | Y bath | Z sq ft | Type | Year | $/sq ft | Days on market"
-            
-            lines = response_text.split('\n')
-            current_property = {}
-            
-            for line in lines:
-                line = line.strip()
-                
-                # Match property title line: "- Title (Location) — $Price"
-                title_match = re.match(r'-\s*(.+?)\s*\((.+?),\s*(.+?),\s*(.+?)\)\s*—\s*\$(.+?)$', line)
-                if title_match:
-                    if current_property:  # Save previous property
-                        properties.append(current_property)
-                    
-                    title, neighborhood, city, state, price_str = title_match.groups()
-                    price = int(price_str.replace(',', '').replace('.0', ''))
-                    
-                    current_property = {
-                        'title': title.strip(),
-                        'city': city.strip(),
-                        'state': state.strip(),
-                        'neighborhood': neighborhood.strip(),
-                        'price': price,
-                        'property_id': 'UNKNOWN'  # Will try to match later
-                    }
-                    continue
-                
-                # Match details line: "X bed | Y bath | Z sq ft | Type | Year | $/sq ft | Days"
-                details_match = re.match(r'(\d+)\s*bed\s*\|\s*(\d+(?:\.\d+)?)\s*bath\s*\|\s*.+?\|\s*(\w+)\s*\|', line)
-                if details_match and current_property:
-                    bedrooms, bathrooms, property_type = details_match.groups()
-                    current_property.update({
-                        'bedrooms': int(bedrooms),
-                        'bathrooms': float(bathrooms),
-                        'property_type': property_type.lower()
-                    })
-                    
-                    # Try to match with known properties based on title, city, price
-                    matched_id = self._find_matching_property_id(current_property)
-                    if matched_id:
-                        current_property['property_id'] = matched_id
-            
-            # Add last property
-            if current_property:
-                properties.append(current_property)
-            
+            properties = [self._project_match(m) for m in _BLOCK_RE.finditer(response_text)]
             logger.info(f"Parsed {len(properties)} properties from agent response")
             return properties
             
@@ -246,45 +453,83 @@ class PerformancePipeline:
             logger.error(f"Error parsing agent response: {str(e)}")
             return []
     
+    def _project_match(self, match: re.Match) -> Dict[str, Any]:
+        """Build a property dict from one agent response block match."""
+        fields = match.groupdict()
+        parsed_property = {
+            'title': fields['title'].strip(),
+            'city': fields['city'].strip(),
+            'state': fields['state'].strip(),
+            'neighborhood': fields['neighborhood'].strip(),
+            'price': int(float(fields['price'].replace(',', ''))),
+            'property_id': 'UNKNOWN'  # Will try to match below
+        }
+        
+        if fields['bedrooms'] is not None:
+            parsed_property.update({
+                'bedrooms': int(fields['bedrooms']),
+                'bathrooms': float(fields['bathrooms']),
+                'property_type': fields['property_type'].lower()
+            })
+            
+            # Try to match with known properties based on title, city, price
+            matched_id = self._find_matching_property_id(parsed_property)
+            if matched_id:
+                parsed_property['property_id'] = matched_id
+        
+        return parsed_property
+    
     def _find_matching_property_id(self, parsed_property: Dict[str, Any]) -> Optional[str]:
         """Find matching property_id from sample data."""
-        for prop in self.sample_properties:
-            if (prop.title.lower() == parsed_property['title'].lower() and
-                prop.metadata.city.lower() == parsed_property['city'].lower() and
-                prop.metadata.price == parsed_property['price']):
-                return prop.metadata.property_id
-        return None
+        return self._by_tcp.get((
+            parsed_property['title'].lower(),
+            parsed_property['city'].lower(),
+            parsed_property['price']
+        ))
     
     def _get_properties_by_ids(self, property_ids: List[str]) -> List[Dict[str, Any]]:
         """Get property data by IDs for evaluation."""
-        properties_data = []
-        
-        for prop in self.sample_properties:
-            if prop.metadata.property_id in property_ids:
-                properties_data.append({
-                    "property_id": prop.metadata.property_id,
-                    "title": prop.title,
-                    "price": prop.metadata.price,
-                    "bedrooms": prop.metadata.bedrooms,
-                    "bathrooms": prop.metadata.bathrooms,
-                    "city": prop.metadata.city,
-                    "state": prop.metadata.state,
-                    "property_type": prop.metadata.property_type.value,
-                    "amenities": [a.value for a in prop.metadata.amenities]
-                })
-        
-        return properties_data
-
+        return [self._project(self._by_id[pid]) for pid in property_ids if pid in self._by_id]
+    
+    def _project(self, prop: "PropertyListing") -> Dict[str, Any]:
+        """Project a sample listing into the dict shape used by the judge."""
+        return {
+            "property_id": prop.metadata.property_id,
+            "title": prop.title,
+            "price": prop.metadata.price,
+            "bedrooms": prop.metadata.bedrooms,
+            "bathrooms": prop.metadata.bathrooms,
+            "city": prop.metadata.city,
+            "state": prop.metadata.state,
+            "property_type": prop.metadata.property_type.value,
+            "amenities": [a.value for a in prop.metadata.amenities]
+        }
 
-def run_evaluation():
+def run_evaluation(use_semantic_cache: bool = False):
     """Main function to run the evaluation pipeline."""
-    pipeline = PerformancePipeline()
+    pipeline = PerformancePipeline(use_semantic_cache=use_semantic_cache)
     
     print("Starting Performance Evaluation Pipeline")
     print("Testing 8 configurations across 10 test queries")
     print("This will take several minutes...")
     
-    results = pipeline.run_full_evaluation()
+    results = asyncio.run(pipeline.run_full_evaluation_async())
+    
+    print("\nEvaluation completed!")
+    print("Check evaluation/results.json for detailed results")
+    
+    return results
+
+
+def run_batch_evaluation():
+    """Run the evaluation pipeline with judge calls submitted through the Batch API."""
+    pipeline = PerformancePipeline()
+    
+    print("Starting Performance Evaluation Pipeline (Batch API judge)")
+    print("Testing 8 configurations across 10 test queries")
+    print("Judge results may take up to 24 hours to complete...")
+    
+    results = pipeline.run_full_evaluation_batch()
     
     print("\nEvaluation completed!")
     print("Check evaluation/results.json for detailed results")
@@ -293,4 +538,7 @@ def run_evaluation():
 
 
 if __name__ == "__main__":
-    run_evaluation()
\ No newline at end of file
+    if "--batch" in sys.argv:
+        run_batch_evaluation()
+    else:
+        run_evaluation(use_semantic_cache="--semantic-cache" in sys.argv)
\ No newline at end of file
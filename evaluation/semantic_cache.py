@@ -0,0 +1,107 @@
+"""Semantic cache for reusing judge verdicts across paraphrased test queries."""
+
+import shelve
+from typing import List, Dict, Any, Optional
+
+import numpy as np
+from openai import AsyncOpenAI
+
+
+# Shelve key prefix for stored verdicts; one key per entry so inserts never rewrite earlier ones
+_ENTRY_PREFIX = "entry:"
+
+
+class SemanticJudgeCache:
+    """
+    Reuse judge verdicts for semantically equivalent queries.
+
+    A cached verdict is only returned when the query embedding is close enough
+    AND the returned/expected property ID sets are identical, so paraphrases
+    with different results never share a verdict.
+    """
+
+    def __init__(
+        self,
+        client: AsyncOpenAI,
+        path: str = "evaluation/.semantic_cache",
+        threshold: float = 0.92,
+        embedding_model: str = "text-embedding-3-small"
+    ):
+        """Open the on-disk store and load previously cached verdicts."""
+        self.client = client
+        self.threshold = threshold
+        self.embedding_model = embedding_model
+        self._db = shelve.open(path)
+        entry_keys = sorted(
+            (key for key in self._db.keys() if key.startswith(_ENTRY_PREFIX)),
+            key=lambda key: int(key[len(_ENTRY_PREFIX):])
+        )
+        self._entries: List[Dict[str, Any]] = [self._db[key] for key in entry_keys]
+        self._matrix = np.vstack([e["embedding"] for e in self._entries]) if self._entries else None
+        self.stats = {"hits": 0, "misses": 0}
+
+    async def _embed(self, query: str) -> np.ndarray:
+        """Return the unit-normalized query embedding, cached on disk."""
+        key = f"embedding:{self.embedding_model}:{query}"
+        embedding = self._db.get(key)
+        if embedding is None:
+            response = await self.client.embeddings.create(model=self.embedding_model, input=query)
+            embedding = response.data[0].embedding
+            self._db[key] = embedding
+
+        vector = np.asarray(embedding, dtype=np.float32)
+        return vector / np.linalg.norm(vector)
+
+    async def lookup(
+        self,
+        query: str,
+        returned_property_ids: List[str],
+        expected_property_ids: List[str]
+    ) -> Optional[Dict[str, Any]]:
+        """Return a cached verdict for an equivalent query with identical results, or None."""
+        if self._matrix is not None:
+            vector = await self._embed(query)
+            similarities = self._matrix @ vector
+            returned_key = tuple(sorted(returned_property_ids))
+            expected_key = tuple(sorted(expected_property_ids))
+
+            for idx in np.argsort(-similarities):
+                if similarities[idx] <= self.threshold:
+                    break
+                entry = self._entries[idx]
+                if entry["returned_ids"] == returned_key and entry["expected_ids"] == expected_key:
+                    self.stats["hits"] += 1
+                    return dict(entry["evaluation"])
+
+        self.stats["misses"] += 1
+        return None
+
+    async def store(
+        self,
+        query: str,
+        returned_property_ids: List[str],
+        expected_property_ids: List[str],
+        evaluation: Dict[str, Any]
+    ):
+        """Store a judge verdict for later semantic lookups."""
+        vector = await self._embed(query)
+        entry = {
+            "query": query,
+            "embedding": vector,
+            "returned_ids": tuple(sorted(returned_property_ids)),
+            "expected_ids": tuple(sorted(expected_property_ids)),
+            "evaluation": dict(evaluation)
+        }
+        self._db[f"{_ENTRY_PREFIX}{len(self._entries)}"] = entry
+        self._entries.append(entry)
+        self._matrix = vector[None, :] if self._matrix is None else np.vstack([self._matrix, vector])
+
+    def close(self):
+        """Flush and close the underlying database."""
+        self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -1,9 +1,5 @@
 """Basic usage example for the Real Estate AI Agent."""
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -1,23 +1,64 @@
 """Real Estate AI Agent with GPT-5 and search tools (MVP)."""
 
+import threading
 from typing import List, Dict, Any, Optional, Type
 from loguru import logger
 from langchain.tools import BaseTool
 from langchain.agents import AgentExecutor, create_tool_calling_agent  # Updated for GPT-5
 from langchain.prompts import ChatPromptTemplate
 from langchain_openai import ChatOpenAI
-from langchain.callbacks.manager import CallbackManagerForToolRun
-from pydantic import Field
+from langchain.callbacks.manager import AsyncCallbackManagerForToolRun, CallbackManagerForToolRun
 
 from .config import settings
-from .pinecone_client import pinecone_client
+from .pinecone_client import get_pinecone_client
+
+
+# One compact line per hit; terse labels keep the tool output (and the next LLM step) short.
+# Pinecone returns metadata numbers as floats, hence the float-friendly specs.
+_RESULT_TEMPLATE = (
+    "{property_id} | {title} | ${price:,.0f} | {bedrooms:g}bd/{bathrooms:g}ba | {square_feet:,.0f} sqft"
+    " | {property_type} | {neighborhood}, {city}, {state} | {amenities} | built {year_built}"
+    " | {days_on_market:g} days | score {similarity_score:.3f} | {description:.150}"
+)
+_RESULT_DEFAULTS = {
+    "property_id": "N/A", "title": "N/A", "price": 0, "bedrooms": 0, "bathrooms": 0,
+    "square_feet": 0, "property_type": "N/A", "neighborhood": "N/A", "city": "N/A",
+    "state": "N/A", "days_on_market": 0, "description": ""
+}
+
+
+class _HitFields:
+    """Read-only `format_map` view over one hit, so no merged dict is built per result."""
+    
+    __slots__ = ("metadata", "similarity_score")
+    
+    def __init__(self, result: Dict[str, Any]):
+        self.metadata = result.get('metadata') or {}
+        self.similarity_score = result.get('similarity_score', 0)
+    
+    def __getitem__(self, key: str) -> Any:
+        if key == 'similarity_score':
+            return self.similarity_score
+        if key == 'amenities':
+            return ", ".join(self.metadata.get('amenities', ())) or "none"
+        if key == 'year_built':
+            year_built = self.metadata.get('year_built')
+            return f"{year_built:.0f}" if isinstance(year_built, (int, float)) else "N/A"
+        value = self.metadata.get(key)
+        return _RESULT_DEFAULTS[key] if value is None else value
+
+
+def _format_result(result: Dict[str, Any]) -> str:
+    """Render one search hit as a compact `_RESULT_TEMPLATE` line."""
+    return _RESULT_TEMPLATE.format_map(_HitFields(result))
 
 
 class PropertySearchTool(BaseTool):
     """Tool for searching properties with semantic search and filters."""
     
-    name: str = Field(default="search_properties")
-    description: str = Field(default="""
+    # Plain defaults: ClassVar would clash with BaseTool's own name/description fields
+    name: str = "search_properties"
+    description: str = """
     Search for real estate properties using semantic search and metadata filters.
     
     Parameters:
@@ -33,21 +74,28 @@ class PropertySearchTool(BaseTool):
         - min_bathrooms: Minimum number of bathrooms
         - required_amenities: List of amenities like ["pool", "gym", "parking"]
     - top_k (int, optional): Max results to return (default: 10)
+    - queries (list of str, optional): Extra phrasings searched together with `query` in
+      a single batched call; results are merged and deduplicated by property
+    
+    Returns one line per property:
+    id | title | price | beds/baths | size | type | location | amenities | year built | days on market | score | description
     
     Example:
     search_properties("modern apartment with city views", {"city": "Miami", "min_bedrooms": 2, "max_price": 500000})
-    """)
+    """
     
     def _run(
         self, 
         query: str, 
         filters: Optional[Dict[str, Any]] = None, 
         top_k: int = 10,
+        queries: Optional[List[str]] = None,
         run_manager: Optional[CallbackManagerForToolRun] = None
-    ) -> List[Dict[str, Any]]:
+    ) -> str:
         """Execute property search."""
         try:
-            logger.info(f"Searching: query='{query}', filters={filters}")
+            logger.opt(lazy=True).debug("Searching: query='{}', queries={}, filters={}", lambda: query, lambda: queries, lambda: filters)
+            pinecone_client = get_pinecone_client()
             
             # Build Pinecone filters
             pinecone_filters = {}
@@ -55,47 +103,79 @@ class PropertySearchTool(BaseTool):
                 pinecone_filters = pinecone_client.build_metadata_filter(**filters)
             
             # Search
-            results = pinecone_client.search_properties(
-                query=query,
+            all_queries = [query, *(q for q in queries or [] if q != query)]
+            if len(all_queries) == 1:
+                results = pinecone_client.search_properties(
+                    query=query,
+                    filters=pinecone_filters,
+                    top_k=top_k
+                )
+            else:
+                # One embedding request for every phrasing
+                results = _merge_batches(pinecone_client.search_properties_batch(
+                    queries=all_queries,
+                    filters=pinecone_filters,
+                    top_k=top_k
+                ), top_k)
+            
+            return _format_results(results)
+            
+        except Exception as e:
+            logger.error(f"Search error: {str(e)}")
+            return f"Search error: {str(e)}"
+    
+    async def _arun(
+        self, 
+        query: str, 
+        filters: Optional[Dict[str, Any]] = None, 
+        top_k: int = 10,
+        queries: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForToolRun] = None
+    ) -> str:
+        """Execute property search without blocking the event loop, so tool calls in one step overlap."""
+        try:
+            logger.opt(lazy=True).debug("Async searching: query='{}', queries={}, filters={}", lambda: query, lambda: queries, lambda: filters)
+            pinecone_client = get_pinecone_client()
+            
+            pinecone_filters = {}
+            if filters:
+                pinecone_filters = pinecone_client.build_metadata_filter(**filters)
+            
+            all_queries = [query, *(q for q in queries or [] if q != query)]
+            batches = await pinecone_client.asearch_properties_batch(
+                queries=all_queries,
                 filters=pinecone_filters,
                 top_k=top_k
             )
-            
-            # Format for agent
-            formatted_results = []
-            for result in results:
-                metadata = result.get('metadata', {})
-                formatted_results.append({
-                    'property_id': metadata.get('property_id', 'N/A'),
-                    'title': metadata.get('title', 'N/A'),
-                    'price': f"${metadata.get('price', 0):,}",
-                    'bedrooms': metadata.get('bedrooms', 'N/A'),
-                    'bathrooms': metadata.get('bathrooms', 'N/A'),
-                    'square_feet': f"{metadata.get('square_feet', 0):,} sq ft",
-                    'property_type': metadata.get('property_type', 'N/A'),
-                    'city': metadata.get('city', 'N/A'),
-                    'state': metadata.get('state', 'N/A'),
-                    'neighborhood': metadata.get('neighborhood', 'N/A'),
-                    'amenities': metadata.get('amenities', []),
-                    'description': metadata.get('description', 'N/A')[:150] + '...',
-                    'price_per_sqft': f"${metadata.get('price_per_sqft', 0):.0f}/sq ft",
-                    'year_built': metadata.get('year_built', 'N/A'),
-                    'days_on_market': metadata.get('days_on_market', 'N/A'),
-                    'similarity_score': f"{result.get('similarity_score', 0):.3f}"
-                })
-            
-            return formatted_results
+            return _format_results(_merge_batches(batches, top_k))
             
         except Exception as e:
             logger.error(f"Search error: {str(e)}")
-            return []
+            return f"Search error: {str(e)}"
+
+
+def _merge_batches(batches: List[List[Dict[str, Any]]], top_k: int) -> List[Dict[str, Any]]:
+    """Merge per-query result lists, keeping each property's best match."""
+    best = {}
+    for result in (r for batch in batches for r in batch):
+        property_id = result.get('metadata', {}).get('property_id')
+        if property_id not in best or result['similarity_score'] > best[property_id]['similarity_score']:
+            best[property_id] = result
+    return sorted(best.values(), key=lambda r: r['similarity_score'], reverse=True)[:top_k]
+
+
+def _format_results(results: List[Dict[str, Any]]) -> str:
+    """Format search hits for the agent, one line each."""
+    if not results:
+        return "No properties found"
+    return "\n".join(_format_result(result) for result in results)
 
 
 class GetIndexStatsTool(BaseTool):
     """Tool for getting database statistics."""
     
-    name: str = Field(default="get_database_stats")
-    description: str = Field(default="Get statistics about the property database including total number of properties.")
+    name: str = "get_database_stats"
+    description: str = "Get statistics about the property database including total number of properties."
     
     def _run(
         self, 
@@ -103,7 +183,7 @@ class GetIndexStatsTool(BaseTool):
     ) -> Dict[str, Any]:
         """Get database stats."""
         try:
-            stats = pinecone_client.get_index_stats()
+            stats = get_pinecone_client().get_index_stats()
             return {
                 "total_properties": stats.get("total_vectors", 0),
                 "status": "healthy" if stats else "error"
@@ -200,17 +280,54 @@ Use your tools to search the database and provide comprehensive responses."""
             logger.error(f"Error processing query: {str(e)}")
             return f"I encountered an error while searching for properties: {str(e)}"
     
+    async def asearch_properties(self, user_query: str) -> str:
+        """Async variant of `search_properties`; tool calls issued in one step run concurrently."""
+        try:
+            logger.info(f"Processing user query: '{user_query}'")
+            response = await self.agent_executor.ainvoke({"input": user_query})
+            return response.get("output", "I couldn't process your request at this time.")
+            
+        except Exception as e:
+            logger.error(f"Error processing query: {str(e)}")
+            return f"I encountered an error while searching for properties: {str(e)}"
+    
+    async def aclose(self):
+        """Release the async Pinecone session opened by `asearch_properties` on the running loop."""
+        await get_pinecone_client().aclose()
+    
     def get_database_info(self) -> str:
-        """Get information about the property database."""
+        """Get information about the property database, straight from the index stats (no LLM call)."""
         try:
-            response = self.agent_executor.invoke({
-                "input": "What information can you tell me about the property database?"
-            })
-            return response.get("output", "Unable to retrieve database information.")
+            stats = get_pinecone_client().get_index_stats()
+            if not stats:
+                return "Unable to retrieve database information."
+            return (
+                f"Database contains {stats.get('total_vectors', 0):,} properties across "
+                f"{len(stats.get('namespaces') or {})} namespaces "
+                f"(fullness: {stats.get('index_fullness') or 0:.1%})."
+            )
         except Exception as e:
             logger.error(f"Error getting database info: {str(e)}")
             return f"Error retrieving database information: {str(e)}"
 
 
-# Global agent instance
-real_estate_agent = RealEstateAgent()
\ No newline at end of file
+# Global agent instance, created on first use so importing this module does no network I/O
+_real_estate_agent: Optional[RealEstateAgent] = None
+_real_estate_agent_lock = threading.Lock()
+
+
+def get_real_estate_agent() -> RealEstateAgent:
+    """Return the process-wide agent, building it on first call."""
+    global _real_estate_agent
+    if _real_estate_agent is None:
+        with _real_estate_agent_lock:
+            if _real_estate_agent is None:
+                _real_estate_agent = RealEstateAgent()
+    return _real_estate_agent
+
+
+def __getattr__(name: str):
+    """Keep `from .agent import real_estate_agent` working, lazily."""
+    if name == "real_estate_agent":
+        return get_real_estate_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -0,0 +1,68 @@
+"""Columnar (NumPy) property catalog for vectorized metadata filtering."""
+
+from typing import List, Iterable
+
+import numpy as np
+
+from .schemas import PropertyListing, SearchQuery
+
+
+def _int_column(values: Iterable[int], dtype: type, count: int, field: str) -> np.ndarray:
+    """Pack ints into a narrow column, rejecting values the dtype cannot hold instead of wrapping them."""
+    column = np.fromiter(values, dtype=np.int64, count=count)
+    info = np.iinfo(dtype)
+    if count and (column.min() < info.min or column.max() > info.max):
+        raise ValueError(f"{field} must be between {info.min} and {info.max} to fit the catalog")
+    return column.astype(dtype)
+
+
+class PropertyCatalog:
+    """
+    In-memory catalog stored as one NumPy array per numeric field.
+
+    Filtering N listings against a `SearchQuery` is a handful of vectorized
+    comparisons instead of N Python-level attribute checks.
+    """
+
+    def __init__(self, listings: Iterable[PropertyListing]):
+        """Build the column arrays from property listings."""
+        self.listings: List[PropertyListing] = list(listings)
+        metadata = [listing.metadata for listing in self.listings]
+        count = len(metadata)
+
+        self.prices = _int_column((m.price for m in metadata), np.int32, count, "price")
+        self.bedrooms = _int_column((m.bedrooms for m in metadata), np.int8, count, "bedrooms")
+        # float32 holds fractional baths (1.5, 1.75) exactly
+        self.bathrooms = np.fromiter((m.bathrooms for m in metadata), dtype=np.float32, count=count)
+        self.square_feet = _int_column((m.square_feet for m in metadata), np.int32, count, "square_feet")
+        self.days_on_market = _int_column((m.days_on_market for m in metadata), np.int32, count, "days_on_market")
+
+        # Amenities as bitmasks, so required-amenity checks are a single AND per listing
+        self.amenity_masks = np.fromiter((m.amenities_mask for m in metadata), dtype=np.uint32, count=count)
+
+    def __len__(self) -> int:
+        return len(self.listings)
+
+    def filter(self, query: SearchQuery) -> np.ndarray:
+        """Return a boolean mask of listings satisfying the query's numeric and amenity constraints."""
+        mask = np.ones(len(self), dtype=bool)
+
+        if query.min_price is not None:
+            mask &= self.prices >= query.min_price
+        if query.max_price is not None:
+            mask &= self.prices <= query.max_price
+        if query.min_bedrooms is not None:
+            mask &= self.bedrooms >= query.min_bedrooms
+        if query.min_bathrooms is not None:
+            mask &= self.bathrooms >= query.min_bathrooms
+
+        required = query.required_amenities_mask
+        if required:
+            mask &= (self.amenity_masks & required) == required
+
+        return mask
+
+    def select(self, query: SearchQuery) -> List[PropertyListing]:
+        """Return the matching listings, capped at the query's max_results."""
+        indices = np.flatnonzero(self.filter(query))[:query.max_results]
+        return [self.listings[i] for i in indices]
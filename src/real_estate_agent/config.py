@@ -1,9 +1,16 @@
 """Configuration settings for the Real Estate AI Agent."""
 
+from pathlib import Path
 from typing import Optional
+from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+# Relative data paths resolve against the repo root, not the working directory
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+DATA_DIR = PROJECT_ROOT / "data"
+
+
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
     
@@ -23,12 +30,13 @@ class Settings(BaseSettings):
     pinecone_api_key: str
     pinecone_environment: str = "us-east-1-aws"
     pinecone_index_name: str = "real-estate-properties"
-    pinecone_dimension: int = 1536  # For OpenAI embeddings
-    pinecone_metric: str = "cosine"
+    pinecone_dimension: int = 512  # Must match embedding_dimension
+    pinecone_metric: str = "dotproduct"  # OpenAI embeddings are unit-norm, so this ranks like cosine
+    pinecone_namespace_file: Path = DATA_DIR / ".active_namespace"  # Tracks the namespace readers query
     
     # Embedding Configuration
     embedding_model: str = "text-embedding-3-small"
-    embedding_dimension: int = 1536
+    embedding_dimension: int = 512  # text-embedding-3 Matryoshka truncation (native size 1536)
     
     # Search Configuration
     default_top_k: int = 10
@@ -37,6 +45,12 @@ class Settings(BaseSettings):
     app_name: str = "RealEstateAgent"
     app_version: str = "0.1.0"
     log_level: str = "INFO"
+    
+    @field_validator('pinecone_namespace_file')
+    @classmethod
+    def resolve_from_project_root(cls, v: Path) -> Path:
+        """Anchor relative paths at the repo root so every process shares one file."""
+        return v if v.is_absolute() else PROJECT_ROOT / v
 
 
 # Global settings instance
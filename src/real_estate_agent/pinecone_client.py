@@ -1,8 +1,19 @@
 """Simplified Pinecone client for real estate property search (MVP)."""
 
-from typing import List, Dict, Any, Optional
+import os
+import time
+import asyncio
+import queue
+import threading
+import weakref
+from collections import OrderedDict
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Tuple
+import numpy as np
 from loguru import logger
-from pinecone import Pinecone, ServerlessSpec
+from pinecone import Pinecone, PineconeAsyncio, ServerlessSpec
 from langchain_pinecone import PineconeVectorStore
 from langchain_openai import OpenAIEmbeddings
 
@@ -10,6 +21,63 @@ from .config import settings
 from .schemas import PropertyListing
 
 
+# Seconds a get_index_stats result is reused; counts only move on ingest timescales
+_STATS_TTL_S = 30.0
+
+# Keep-alive HTTP connections held by the shared index handle
+_CONNECTION_POOL_MAXSIZE = 32
+
+# Max query embeddings kept in memory; stored as float32, a 512-dim vector is ~2 KB
+_EMBEDDING_CACHE_SIZE = 4096
+
+
+# (filter kwarg, condition builder) pairs applied in order by _build_filter
+_FILTER_SPEC = (
+    ("property_type", lambda v: {"property_type": {"$eq": v}}),
+    ("city", lambda v: {"city": {"$eq": v}}),
+    ("state", lambda v: {"state": {"$eq": v}}),
+    ("neighborhood", lambda v: {"neighborhood": {"$eq": v}}),
+    ("min_bedrooms", lambda v: {"bedrooms": {"$gte": v}}),
+    ("min_bathrooms", lambda v: {"bathrooms": {"$gte": v}}),
+    ("min_price", lambda v: {"price": {"$gte": v}}),
+    ("max_price", lambda v: {"price": {"$lte": v}}),
+)
+
+
+@lru_cache(maxsize=256)
+def _build_filter(items: Tuple[Tuple[str, Any], ...]) -> Dict[str, Any]:
+    """Build a Pinecone metadata filter from sorted (kwarg, value) pairs."""
+    filters = dict(items)
+    
+    # Empty strings/lists mean "no preference"; 0 is still a valid bound
+    filter_conditions = [
+        build(value)
+        for key, build in _FILTER_SPEC
+        if (value := filters.get(key)) not in (None, "", [])
+    ]
+    
+    # Amenities filter (Pinecone has no $all, so one clause per required amenity)
+    for amenity in filters.get("required_amenities") or ():
+        filter_conditions.append({"amenities": {"$in": [amenity]}})
+    
+    # Property status filter (default to active)
+    filter_conditions.append({"status": {"$eq": filters.get("status", "active")}})
+    
+    # Combine all conditions
+    if len(filter_conditions) == 1:
+        return filter_conditions[0]
+    return {"$and": filter_conditions}
+
+
+def chunks(iterable: Iterable[Any], batch_size: int = 100) -> Iterator[List[Any]]:
+    """Yield successive lists of up to batch_size items from an iterable."""
+    it = iter(iterable)
+    chunk = list(islice(it, batch_size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(it, batch_size))
+
+
 class PineconeClient:
     """Simplified client for managing Pinecone operations for real estate data."""
     
@@ -20,6 +88,20 @@ class PineconeClient:
         self.index = None
         self.vector_store = None
         self.embeddings = None
+        self._active_namespace = ""
+        self._namespace_mtime = None  # mtime_ns of the namespace file when last read
+        
+        # LRU of query embeddings keyed by (model, normalized query)
+        self._embedding_cache: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+        self._embedding_lock = threading.Lock()
+        self.embedding_cache_stats = {"hits": 0, "misses": 0}
+        self._stats_cache = (0.0, None)  # (monotonic fetch time, stats)
+        self.index_host = None
+        
+        # asyncio (PineconeAsyncio, IndexAsyncio) handles per event loop; aiohttp sessions
+        # are bound to the loop that opened them, so each loop gets its own pair
+        self._async_indexes: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, tuple]" = weakref.WeakKeyDictionary()
+        self._async_indexes_lock = threading.Lock()
         
         self._setup_embeddings()
         self._setup_index()
@@ -55,8 +137,28 @@ class PineconeClient:
             else:
                 logger.info(f"Using existing Pinecone index: {self.index_name}")
             
-            # Get index reference
-            self.index = self.pc.Index(self.index_name)
+            description = self.pc.describe_index(self.index_name)
+            if description.dimension != settings.embedding_dimension:
+                raise ValueError(
+                    f"Index '{self.index_name}' has dimension {description.dimension} but embeddings "
+                    f"are {settings.embedding_dimension}-dim; re-ingest into a new index or set "
+                    f"EMBEDDING_DIMENSION/PINECONE_DIMENSION to {description.dimension}"
+                )
+            
+            if description.metric != settings.pinecone_metric:
+                logger.warning(
+                    f"Index '{self.index_name}' uses metric '{description.metric}', "
+                    f"not '{settings.pinecone_metric}'; it only applies to newly created indexes"
+                )
+            
+            # Get index reference; one keep-alive pool shared by every search, sized for
+            # the concurrent batch queries, then warmed so the first tool call skips TLS setup
+            self.index_host = description.host  # Also used by the asyncio client
+            self.index = self.pc.Index(
+                host=self.index_host,
+                connection_pool_maxsize=_CONNECTION_POOL_MAXSIZE
+            )
+            self.get_index_stats(force_refresh=True)
             
         except Exception as e:
             logger.error(f"Error setting up Pinecone index: {str(e)}")
@@ -78,15 +180,76 @@ class PineconeClient:
             logger.error(f"Error setting up vector store: {str(e)}")
             raise
     
-    def get_index_stats(self) -> Dict[str, Any]:
-        """Get index statistics."""
+    @property
+    def active_namespace(self) -> str:
+        """Namespace that searches and upserts target (default namespace if unset).
+        
+        The namespace file is re-read whenever its mtime changes, so a long-running
+        process follows namespaces activated by other processes' ingestion runs.
+        """
+        path = settings.pinecone_namespace_file
+        try:
+            mtime = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        
+        if mtime != self._namespace_mtime:
+            try:
+                self._active_namespace = path.read_text().strip()
+            except FileNotFoundError:
+                self._active_namespace = ""
+            self._namespace_mtime = mtime
+        return self._active_namespace
+    
+    def activate_namespace(self, namespace: str) -> Optional[threading.Thread]:
+        """Point reads at a freshly ingested namespace and retire the old one in the background.
+        
+        Returns the cleanup thread (non-daemon, so the process waits for it on exit), or None
+        when there is nothing to retire: the default namespace and a re-activated namespace are kept.
+        """
+        old_namespace = self.active_namespace
+        
+        # Write-then-rename, so readers never see a half-written file
+        path = settings.pinecone_namespace_file
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_text(namespace)
+        os.replace(tmp_path, path)
+        logger.info(f"Active namespace switched from '{old_namespace}' to '{namespace}'")
+        
+        if not old_namespace or old_namespace == namespace:
+            return None
+        
+        cleanup = threading.Thread(target=self.delete_namespace, args=(old_namespace,))
+        cleanup.start()
+        return cleanup
+    
+    def delete_namespace(self, namespace: str) -> bool:
+        """Delete every vector in a namespace."""
+        try:
+            self.index.delete(delete_all=True, namespace=namespace)
+            self._stats_cache = (0.0, None)
+            logger.info(f"Deleted namespace '{namespace}'")
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting namespace '{namespace}': {str(e)}")
+            return False
+    
+    def get_index_stats(self, force_refresh: bool = False) -> Dict[str, Any]:
+        """Get index statistics, reusing a result fetched in the last `_STATS_TTL_S` seconds."""
+        fetched_at, cached = self._stats_cache
+        if not force_refresh and cached is not None and time.monotonic() - fetched_at < _STATS_TTL_S:
+            return dict(cached)
+        
         try:
             stats = self.index.describe_index_stats()
-            return {
+            result = {
                 "total_vectors": stats.total_vector_count,
                 "index_fullness": stats.index_fullness,
                 "namespaces": stats.namespaces
             }
+            self._stats_cache = (time.monotonic(), result)
+            return dict(result)
         except Exception as e:
             logger.error(f"Error getting index stats: {str(e)}")
             return {}
@@ -96,60 +259,155 @@ class PineconeClient:
         try:
             # Only vectorize the description
             documents = [property_listing.description]
-            metadatas = [property_listing.to_dict_for_pinecone()["metadata"]]
+            metadatas = [property_listing.pinecone_metadata()]
             ids = [property_listing.metadata.property_id]
             
             self.vector_store.add_texts(
                 texts=documents,
                 metadatas=metadatas,
-                ids=ids
+                ids=ids,
+                namespace=self.active_namespace
             )
             
-            logger.info(f"Successfully upserted property: {property_listing.metadata.property_id}")
+            logger.debug("Successfully upserted property: {}", property_listing.metadata.property_id)
             return True
             
         except Exception as e:
             logger.error(f"Error upserting property {property_listing.metadata.property_id}: {str(e)}")
             return False
     
-    def upsert_properties(self, property_listings: List[PropertyListing], batch_size: int = 100) -> Dict[str, int]:
-        """Upsert multiple property listings to Pinecone in batches."""
+    def upsert_properties(
+        self,
+        property_listings: List[PropertyListing],
+        batch_size: int = 100,
+        max_workers: int = 8
+    ) -> Dict[str, int]:
+        """Upsert multiple property listings to Pinecone in batches.
+        
+        Descriptions are embedded up front (the embeddings client batches the requests),
+        then the upsert batches are written concurrently.
+        """
         total_properties = len(property_listings)
         successful_upserts = 0
         failed_upserts = 0
         
         logger.info(f"Starting batch upsert of {total_properties} properties")
         
-        for i in range(0, total_properties, batch_size):
-            batch = property_listings[i:i + batch_size]
-            batch_texts = []
-            batch_metadatas = []
-            batch_ids = []
-            
-            for property_listing in batch:
+        metadatas = []
+        for property_listing in property_listings:
+            try:
+                metadatas.append(property_listing.pinecone_metadata())
+            except Exception as e:
+                logger.error(f"Error preparing property {property_listing.metadata.property_id}: {str(e)}")
+                failed_upserts += 1
+        
+        # Only the description is vectorized; ids and texts are read back from the metadata
+        ids = [metadata["property_id"] for metadata in metadatas]
+        texts = [metadata["description"] for metadata in metadatas]
+        
+        try:
+            embeddings = self.embeddings.embed_documents(texts) if texts else []
+        except Exception as e:
+            logger.error(f"Error embedding properties: {str(e)}")
+            embeddings = []
+            failed_upserts += len(texts)
+        
+        vectors = list(zip(ids, embeddings, metadatas))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.index.upsert, vectors=batch, namespace=self.active_namespace): len(batch)
+                for batch in chunks(vectors, batch_size)
+            }
+            for future in as_completed(futures):
                 try:
-                    # Only use description for vectorization
-                    batch_texts.append(property_listing.description)
-                    batch_metadatas.append(property_listing.to_dict_for_pinecone()["metadata"])
-                    batch_ids.append(property_listing.metadata.property_id)
+                    future.result()
+                    successful_upserts += futures[future]
                 except Exception as e:
-                    logger.error(f"Error preparing property {property_listing.metadata.property_id}: {str(e)}")
-                    failed_upserts += 1
-                    continue
-            
+                    logger.error(f"Error upserting batch: {str(e)}")
+                    failed_upserts += futures[future]
+        
+        result = {
+            "total": total_properties,
+            "successful": successful_upserts,
+            "failed": failed_upserts
+        }
+        
+        self._stats_cache = (0.0, None)  # Vector counts changed
+        logger.info(f"Batch upsert completed: {result}")
+        return result
+    
+    def upsert_properties_parallel(
+        self,
+        property_listings: Iterable[PropertyListing],
+        batch_size: int = 100,
+        pool_threads: int = 30,
+        namespace: Optional[str] = None
+    ) -> Dict[str, int]:
+        """Upsert property listings with chunked, parallel requests (bulk ingestion mode).
+        
+        Accepts any iterable, so a generator is consumed chunk by chunk as it is produced.
+        Writes to the active namespace unless another namespace is given.
+        """
+        if namespace is None:
+            namespace = self.active_namespace
+        
+        total_properties = 0
+        successful_upserts = 0
+        failed_upserts = 0
+        
+        logger.info(f"Starting parallel upsert (batch_size={batch_size}, pool_threads={pool_threads})")
+        
+        # Embedding runs in a producer thread, bounded so it stays at most two batches ahead
+        embedded_batches: queue.Queue = queue.Queue(maxsize=2)
+        
+        def embed_batches():
             try:
-                if batch_texts:
-                    self.vector_store.add_texts(
-                        texts=batch_texts,
-                        metadatas=batch_metadatas,
-                        ids=batch_ids
-                    )
-                    successful_upserts += len(batch_texts)
-                    logger.info(f"Batch {i//batch_size + 1}: Upserted {len(batch_texts)} properties")
+                for batch in chunks(property_listings, batch_size):
+                    try:
+                        # Only vectorize the description
+                        embeddings = self.embeddings.embed_documents([p.description for p in batch])
+                    except Exception as e:
+                        logger.error(f"Error embedding batch: {str(e)}")
+                        embeddings = None
+                    embedded_batches.put((batch, embeddings))
+            finally:
+                embedded_batches.put(None)  # Sentinel: no more batches
+        
+        with ThreadPoolExecutor(max_workers=1) as executor, \
+                self.pc.Index(self.index_name, pool_threads=pool_threads) as index:
+            producer = executor.submit(embed_batches)
+            pending = []
+            
+            while True:
+                item = embedded_batches.get()
+                if item is None:
+                    break
                 
-            except Exception as e:
-                logger.error(f"Error upserting batch {i//batch_size + 1}: {str(e)}")
-                failed_upserts += len(batch_texts)
+                batch, embeddings = item
+                total_properties += len(batch)
+                if embeddings is None:
+                    failed_upserts += len(batch)
+                    continue
+                
+                try:
+                    vectors = [
+                        (p.metadata.property_id, values, p.pinecone_metadata())
+                        for p, values in zip(batch, embeddings)
+                    ]
+                    pending.append((len(vectors), index.upsert(vectors=vectors, namespace=namespace, async_req=True)))
+                except Exception as e:
+                    logger.error(f"Error preparing batch: {str(e)}")
+                    failed_upserts += len(batch)
+            
+            producer.result()  # Re-raise errors from the input iterable
+            
+            for batch_count, async_result in pending:
+                try:
+                    async_result.get()
+                    successful_upserts += batch_count
+                except Exception as e:
+                    logger.error(f"Error upserting batch: {str(e)}")
+                    failed_upserts += batch_count
         
         result = {
             "total": total_properties,
@@ -157,92 +415,225 @@ class PineconeClient:
             "failed": failed_upserts
         }
         
-        logger.info(f"Batch upsert completed: {result}")
+        self._stats_cache = (0.0, None)  # Vector counts changed
+        logger.info(f"Parallel upsert completed: {result}")
         return result
     
+    def _lookup_embeddings(self, queries: List[str]) -> Tuple[List[tuple], Dict[tuple, np.ndarray], List[tuple]]:
+        """Split queries into cache keys, cached vectors and the (deduplicated) keys to embed."""
+        keys = [(settings.embedding_model, query.strip().lower()) for query in queries]
+        
+        with self._embedding_lock:
+            found = {}
+            for key in keys:
+                vector = self._embedding_cache.get(key)
+                if vector is not None:
+                    self._embedding_cache.move_to_end(key)
+                    found[key] = vector
+            hits = sum(key in found for key in keys)
+            self.embedding_cache_stats["hits"] += hits
+            self.embedding_cache_stats["misses"] += len(keys) - hits
+        
+        missing = list(dict.fromkeys(key for key in keys if key not in found))
+        return keys, found, missing
+    
+    def _store_embeddings(self, found: Dict[tuple, np.ndarray], missing: List[tuple], vectors: List[List[float]]):
+        """Add freshly embedded vectors to the LRU cache and to `found`."""
+        with self._embedding_lock:
+            for key, vector in zip(missing, vectors):
+                found[key] = self._embedding_cache[key] = np.asarray(vector, dtype=np.float32)
+            while len(self._embedding_cache) > _EMBEDDING_CACHE_SIZE:
+                self._embedding_cache.popitem(last=False)
+    
+    def embed_queries(self, queries: List[str]) -> List[List[float]]:
+        """Embed search queries, serving repeats from the LRU cache.
+        
+        Queries are normalized (stripped, lowercased) before lookup, and all misses
+        are embedded together in a single request.
+        """
+        keys, found, missing = self._lookup_embeddings(queries)
+        if missing:
+            self._store_embeddings(found, missing, self.embeddings.embed_documents([text for _, text in missing]))
+        
+        logger.opt(lazy=True).debug("Query embedding cache: {}", lambda: dict(self.embedding_cache_stats))
+        return [found[key].tolist() for key in keys]
+    
+    async def aembed_queries(self, queries: List[str]) -> List[List[float]]:
+        """Async variant of `embed_queries` sharing the same cache."""
+        keys, found, missing = self._lookup_embeddings(queries)
+        if missing:
+            self._store_embeddings(found, missing, await self.embeddings.aembed_documents([text for _, text in missing]))
+        
+        logger.opt(lazy=True).debug("Query embedding cache: {}", lambda: dict(self.embedding_cache_stats))
+        return [found[key].tolist() for key in keys]
+    
     def search_properties(
         self,
         query: str,
         filters: Optional[Dict[str, Any]] = None,
         top_k: int = 10,
-        namespace: str = ""
+        namespace: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """Search for properties using semantic similarity and metadata filters."""
+        if namespace is None:
+            namespace = self.active_namespace
+        
         try:
-            logger.info(f"Searching properties with query: '{query}', filters: {filters}")
+            logger.opt(lazy=True).debug("Searching properties with query: '{}', filters: {}", lambda: query, lambda: filters)
             
-            results = self.vector_store.similarity_search_with_score(
-                query=query,
-                k=top_k,
-                filter=filters,
-                namespace=namespace
+            # Query the index directly so the embedding comes from the cache
+            response = self.index.query(
+                vector=self.embed_queries([query])[0],
+                top_k=top_k,
+                filter=filters or None,
+                namespace=namespace,
+                include_metadata=True
             )
             
-            formatted_results = []
-            for doc, score in results:
-                result = {
-                    "content": doc.page_content,  # This will be the description
-                    "metadata": doc.metadata,
-                    "similarity_score": score,
-                }
-                formatted_results.append(result)
+            formatted_results = [self._format_match(match) for match in response.matches]
             
-            logger.info(f"Found {len(formatted_results)} matching properties")
+            logger.debug("Found {} matching properties", len(formatted_results))
             return formatted_results
             
         except Exception as e:
             logger.error(f"Error searching properties: {str(e)}")
             return []
     
-    def build_metadata_filter(self, **filters) -> Dict[str, Any]:
-        """Build metadata filter for Pinecone search (simplified for MVP)."""
-        filter_conditions = []
-        
-        # Property type filter
-        if "property_type" in filters and filters["property_type"]:
-            filter_conditions.append({"property_type": {"$eq": filters["property_type"]}})
-        
-        # Location filters
-        if "city" in filters and filters["city"]:
-            filter_conditions.append({"city": {"$eq": filters["city"]}})
+    def search_properties_batch(
+        self,
+        queries: List[str],
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: int = 10,
+        namespace: Optional[str] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """Search several queries with one embedding request and concurrent index queries.
         
-        if "state" in filters and filters["state"]:
-            filter_conditions.append({"state": {"$eq": filters["state"]}})
+        Returns one result list per query, in the same format as `search_properties`.
+        """
+        if namespace is None:
+            namespace = self.active_namespace
+        if not queries:
+            return []
         
-        if "neighborhood" in filters and filters["neighborhood"]:
-            filter_conditions.append({"neighborhood": {"$eq": filters["neighborhood"]}})
+        try:
+            logger.opt(lazy=True).debug("Batch searching {} queries, filters: {}", lambda: len(queries), lambda: filters)
+            vectors = self.embed_queries(queries)
+        except Exception as e:
+            logger.error(f"Error embedding search queries: {str(e)}")
+            return [[] for _ in queries]
         
-        # Bedroom/bathroom filters
-        if "min_bedrooms" in filters and filters["min_bedrooms"] is not None:
-            filter_conditions.append({"bedrooms": {"$gte": filters["min_bedrooms"]}})
+        def query_one(vector: List[float]) -> List[Dict[str, Any]]:
+            try:
+                response = self.index.query(
+                    vector=vector,
+                    top_k=top_k,
+                    filter=filters or None,
+                    namespace=namespace,
+                    include_metadata=True
+                )
+                return [self._format_match(match) for match in response.matches]
+            except Exception as e:
+                logger.error(f"Error searching properties: {str(e)}")
+                return []
         
-        if "min_bathrooms" in filters and filters["min_bathrooms"] is not None:
-            filter_conditions.append({"bathrooms": {"$gte": filters["min_bathrooms"]}})
+        # No more threads than pooled connections; extra workers would just wait on the pool
+        with ThreadPoolExecutor(max_workers=min(len(vectors), _CONNECTION_POOL_MAXSIZE)) as executor:
+            return list(executor.map(query_one, vectors))
+    
+    async def asearch_properties_batch(
+        self,
+        queries: List[str],
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: int = 10,
+        namespace: Optional[str] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """Async variant of `search_properties_batch`; index queries run concurrently on the event loop."""
+        if namespace is None:
+            namespace = self.active_namespace
+        if not queries:
+            return []
         
-        # Price filters
-        if "min_price" in filters and filters["min_price"] is not None:
-            filter_conditions.append({"price": {"$gte": filters["min_price"]}})
+        try:
+            logger.opt(lazy=True).debug("Async searching {} queries, filters: {}", lambda: len(queries), lambda: filters)
+            vectors = await self.aembed_queries(queries)
+        except Exception as e:
+            logger.error(f"Error embedding search queries: {str(e)}")
+            return [[] for _ in queries]
         
-        if "max_price" in filters and filters["max_price"] is not None:
-            filter_conditions.append({"price": {"$lte": filters["max_price"]}})
+        index = self._get_async_index()
         
-        # Amenities filter
-        if "required_amenities" in filters and filters["required_amenities"]:
-            for amenity in filters["required_amenities"]:
-                filter_conditions.append({"amenities": {"$in": [amenity]}})
+        async def query_one(vector: List[float]) -> List[Dict[str, Any]]:
+            try:
+                response = await index.query(
+                    vector=vector,
+                    top_k=top_k,
+                    filter=filters or None,
+                    namespace=namespace,
+                    include_metadata=True
+                )
+                return [self._format_match(match) for match in response.matches]
+            except Exception as e:
+                logger.error(f"Error searching properties: {str(e)}")
+                return []
         
-        # Property status filter (default to active)
-        status = filters.get("status", "active")
-        filter_conditions.append({"status": {"$eq": status}})
+        return list(await asyncio.gather(*(query_one(vector) for vector in vectors)))
+    
+    def _get_async_index(self):
+        """Return the running event loop's IndexAsyncio handle, opening it on first use."""
+        loop = asyncio.get_running_loop()
+        with self._async_indexes_lock:
+            handles = self._async_indexes.get(loop)
+            if handles is None:
+                pc = PineconeAsyncio(api_key=settings.pinecone_api_key)
+                handles = self._async_indexes[loop] = (pc, pc.IndexAsyncio(host=self.index_host))
+        return handles[1]
+    
+    async def aclose(self):
+        """Close the running event loop's asyncio index handle; call before the loop shuts down."""
+        with self._async_indexes_lock:
+            handles = self._async_indexes.pop(asyncio.get_running_loop(), None)
+        if handles is not None:
+            pc, index = handles
+            await index.close()
+            await pc.close()
+    
+    @staticmethod
+    def _format_match(match) -> Dict[str, Any]:
+        """Shape a raw index match as a search result; metadata is passed through uncopied."""
+        return {
+            "metadata": match.metadata or {},  # Includes the description text
+            "similarity_score": match.score,
+        }
+    
+    def build_metadata_filter(self, **filters) -> Dict[str, Any]:
+        """Build metadata filter for Pinecone search (simplified for MVP).
         
-        # Combine all conditions
-        if len(filter_conditions) == 1:
-            return filter_conditions[0]
-        elif len(filter_conditions) > 1:
-            return {"$and": filter_conditions}
-        else:
-            return {}
+        Filters are memoized per distinct filter set and shared between calls; treat them as read-only.
+        """
+        items = tuple(sorted((k, tuple(v) if isinstance(v, list) else v) for k, v in filters.items()))
+        try:
+            return _build_filter(items)
+        except TypeError:  # Unhashable filter value, build without the cache
+            return _build_filter.__wrapped__(items)
+
+
+# Global client instance, created on first use so importing this module does no network I/O
+_pinecone_client: Optional[PineconeClient] = None
+_pinecone_client_lock = threading.Lock()
+
+
+def get_pinecone_client() -> PineconeClient:
+    """Return the process-wide Pinecone client, connecting on first call."""
+    global _pinecone_client
+    if _pinecone_client is None:
+        with _pinecone_client_lock:
+            if _pinecone_client is None:
+                _pinecone_client = PineconeClient()
+    return _pinecone_client
 
 
-# Global client instance
-pinecone_client = PineconeClient()
\ No newline at end of file
+def __getattr__(name: str):
+    """Keep `from .pinecone_client import pinecone_client` working, lazily."""
+    if name == "pinecone_client":
+        return get_pinecone_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -0,0 +1,354 @@
+"""Sample property dataset shared by the ingestion scripts and the evaluation pipeline.
+
+`days_on_market` is drawn from a seeded generator, so a given seed always yields the
+same listings and vector payloads; changing the seed changes what gets ingested.
+"""
+
+import argparse
+import json
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Iterable, Iterator, Optional
+
+import numpy as np
+from loguru import logger
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to stdlib json
+    orjson = None
+
+from .config import DATA_DIR
+from .schemas import PropertyListing, PropertyType, Amenity, PropertyStatus, _AMENITY_VALUE, _PTYPE_VALUE
+
+
+DATA_DIR.mkdir(parents=True, exist_ok=True)
+
+
+# Expanded sample data with comprehensive descriptions. Amenity combinations are
+# immutable tuples built once at import; listings get their own list copy at construction.
+_SAMPLE_DATA = (
+    {
+        "title": "Luxury Waterfront Condo in Miami Beach",
+        "description": "Stunning 2-bedroom, 2-bathroom oceanfront condominium with breathtaking panoramic water views from floor-to-ceiling windows. This modern unit features an open-concept living design with premium granite countertops, stainless steel appliances, and custom cabinetry. The spacious master suite includes a walk-in closet and spa-like en-suite bathroom with marble finishes. Private balcony perfect for morning coffee overlooking the Atlantic Ocean. Building amenities include resort-style pool deck, state-of-the-art fitness center, 24-hour concierge, and valet parking. Located in prestigious South Beach with easy access to world-class dining, shopping, and entertainment.",
+        "property_type": PropertyType.CONDO,
+        "price": 750000,
+        "bedrooms": 2,
+        "bathrooms": 2.0,
+        "square_feet": 1200,
+        "city": "Miami Beach",
+        "state": "FL",
+        "neighborhood": "South Beach",
+        "year_built": 2020,
+        "amenities": (Amenity.POOL, Amenity.GYM, Amenity.BALCONY, Amenity.PARKING),
+        "listing_agent": "Maria Rodriguez"
+    },
+    {
+        "title": "Modern Family House in Austin",
+        "description": "Beautiful single-family home featuring 4 spacious bedrooms and 3 full bathrooms, perfect for growing families. This contemporary design showcases an open floor plan with soaring ceilings and abundant natural light throughout. The gourmet kitchen boasts quartz countertops, professional-grade stainless steel appliances, and large center island ideal for entertaining. Genuine hardwood flooring flows seamlessly from room to room. The master suite offers a luxurious retreat with walk-in closet and dual vanity bathroom. Private backyard with mature landscaping provides space for outdoor activities and gardening. Located in highly-rated school district with parks and family amenities nearby.",
+        "property_type": PropertyType.HOUSE,
+        "price": 485000,
+        "bedrooms": 4,
+        "bathrooms": 3.0,
+        "square_feet": 2200,
+        "city": "Austin",
+        "state": "TX",
+        "neighborhood": "Cedar Park",
+        "year_built": 2018,
+        "amenities": (Amenity.HARDWOOD_FLOORS, Amenity.FIREPLACE, Amenity.PARKING),
+        "listing_agent": "John Smith"
+    },
+    {
+        "title": "Cozy Studio in Manhattan",
+        "description": "Charming studio apartment strategically located in the vibrant heart of Manhattan's Chelsea neighborhood. This recently renovated unit maximizes every square foot with intelligent design and premium finishes. Features include modern stainless steel appliances, sleek granite countertops, and custom built-in storage solutions. High ceilings and oversized windows create an airy feel while flooding the space with natural light. Original hardwood floors add warmth and character. The updated bathroom includes contemporary fixtures and efficient layout. Building provides excellent maintenance and security. Prime location offers unbeatable walkability with subway stations, acclaimed restaurants, shopping, and cultural attractions all within blocks.",
+        "property_type": PropertyType.STUDIO,
+        "price": 320000,
+        "bedrooms": 0,
+        "bathrooms": 1.0,
+        "square_feet": 450,
+        "city": "New York",
+        "state": "NY",
+        "neighborhood": "Chelsea",
+        "year_built": 1995,
+        "amenities": (Amenity.DISHWASHER, Amenity.HARDWOOD_FLOORS),
+        "listing_agent": "Sarah Johnson"
+    },
+    {
+        "title": "Luxury Townhouse in San Francisco",
+        "description": "Elegant three-bedroom, two-and-half-bathroom townhouse offering spectacular panoramic views of San Francisco's iconic skyline and bay. This sophisticated residence features a gourmet kitchen equipped with top-of-the-line appliances, custom cabinetry, and premium stone countertops. The living area centers around a beautiful fireplace creating perfect ambiance for relaxation. Original architectural details blend seamlessly with modern updates throughout. Private two-car garage provides secure parking in this premium location. The master bedroom includes walk-in closet and luxury bathroom with dual vanities. Located in the prestigious Nob Hill neighborhood with convenient access to major technology companies, fine dining, and cultural attractions.",
+        "property_type": PropertyType.TOWNHOUSE,
+        "price": 1200000,
+        "bedrooms": 3,
+        "bathrooms": 2.5,
+        "square_feet": 1800,
+        "city": "San Francisco",
+        "state": "CA",
+        "neighborhood": "Nob Hill",
+        "year_built": 2019,
+        "amenities": (Amenity.FIREPLACE, Amenity.PARKING, Amenity.HARDWOOD_FLOORS, Amenity.DISHWASHER),
+        "listing_agent": "David Chen"
+    },
+    {
+        "title": "Pet-Friendly Apartment in Denver",
+        "description": "Spacious two-bedroom, one-bathroom apartment designed with pet owners in mind. This well-appointed unit features in-unit washer and dryer for convenience, central air conditioning for year-round comfort, and private balcony overlooking tree-lined streets. The modern kitchen includes energy-efficient appliances and ample cabinet storage. Both bedrooms offer generous closet space and large windows. The pet-friendly building welcomes furry companions with nearby dog park and walking trails. Located in trendy Capitol Hill neighborhood known for its vibrant arts scene, local breweries, and easy access to outdoor recreation including hiking and biking trails in the nearby foothills.",
+        "property_type": PropertyType.APARTMENT,
+        "price": 275000,
+        "bedrooms": 2,
+        "bathrooms": 1.0,
+        "square_feet": 950,
+        "city": "Denver",
+        "state": "CO",
+        "neighborhood": "Capitol Hill",
+        "year_built": 2015,
+        "amenities": (Amenity.PET_FRIENDLY, Amenity.WASHER_DRYER, Amenity.AIR_CONDITIONING, Amenity.BALCONY),
+        "listing_agent": "Lisa Martinez"
+    },
+    {
+        "title": "Beachfront House in San Diego",
+        "description": "Extraordinary five-bedroom, four-bathroom oceanfront estate offering unparalleled luxury and direct beach access. Every room showcases stunning Pacific Ocean views through expansive windows and sliding glass doors. The chef's kitchen features professional-grade appliances, granite countertops, and custom cabinetry perfect for entertaining. The master suite serves as a private retreat with panoramic ocean views, walk-in closet, and spa-like bathroom with soaking tub. Private swimming pool and outdoor living areas create an resort-like atmosphere. Additional bedrooms offer flexibility for guests or home office space. The property includes direct beach access, making it ideal for the California coastal lifestyle with surfing, swimming, and beachside relaxation.",
+        "property_type": PropertyType.HOUSE,
+        "price": 2500000,
+        "bedrooms": 5,
+        "bathrooms": 4.0,
+        "square_feet": 3200,
+        "city": "San Diego",
+        "state": "CA",
+        "neighborhood": "La Jolla",
+        "year_built": 2021,
+        "amenities": (Amenity.POOL, Amenity.HARDWOOD_FLOORS, Amenity.DISHWASHER, Amenity.PARKING),
+        "listing_agent": "Michael Brown"
+    },
+    {
+        "title": "High-Rise Condo in Chicago",
+        "description": "Stunning three-bedroom, two-bathroom condominium on the 25th floor offering breathtaking city skyline views. This modern unit features floor-to-ceiling windows maximizing natural light and showcasing Chicago's architectural beauty. The kitchen includes premium granite countertops, stainless steel appliances, and contemporary cabinetry. Open living and dining areas provide ideal space for entertaining with spectacular urban backdrop. The master bedroom offers city views and generous closet space. Building amenities include professionally equipped fitness center, rooftop deck with panoramic views, and secure parking garage. Located in trendy River North neighborhood with easy access to downtown business district, world-class restaurants, shopping along Magnificent Mile, and lakefront recreational activities.",
+        "property_type": PropertyType.CONDO,
+        "price": 625000,
+        "bedrooms": 3,
+        "bathrooms": 2.0,
+        "square_feet": 1500,
+        "city": "Chicago",
+        "state": "IL",
+        "neighborhood": "River North",
+        "year_built": 2017,
+        "amenities": (Amenity.GYM, Amenity.DISHWASHER, Amenity.PARKING),
+        "listing_agent": "Jennifer Wilson"
+    },
+    {
+        "title": "Charming Cottage in Portland",
+        "description": "Adorable two-bedroom, one-bathroom cottage combining vintage charm with thoughtful modern updates. This character-filled home features original hardwood floors throughout, adding warmth and historic appeal. The living room centers around a cozy brick fireplace perfect for Portland's cooler evenings. Updated kitchen maintains period charm while offering modern functionality. Both bedrooms provide comfortable spaces with good natural light and original architectural details. The property includes a beautifully maintained garden with mature plantings and space for outdoor relaxation. Located in the trendy Alberta neighborhood known for its artistic community, local cafes, and easy access to public transportation. Perfect for first-time buyers seeking character and convenient urban location.",
+        "property_type": PropertyType.HOUSE,
+        "price": 395000,
+        "bedrooms": 2,
+        "bathrooms": 1.0,
+        "square_feet": 1100,
+        "city": "Portland",
+        "state": "OR",
+        "neighborhood": "Alberta",
+        "year_built": 1955,
+        "amenities": (Amenity.HARDWOOD_FLOORS, Amenity.FIREPLACE),
+        "listing_agent": "Ryan Thompson"
+    },
+    # NEW PROPERTIES (4 additional)
+    {
+        "title": "Modern Loft in Brooklyn",
+        "description": "Industrial-chic two-bedroom, two-bathroom loft featuring soaring 12-foot ceilings, exposed brick walls, and polished concrete floors. This converted warehouse space offers an open floor plan ideal for contemporary living and entertaining. The kitchen showcases stainless steel appliances, quartz countertops, and custom steel cabinetry maintaining the industrial aesthetic. Large windows provide abundant natural light and views of the Manhattan skyline. The master bedroom includes an en-suite bathroom and walk-in closet. Additional bedroom works perfectly as guest room or home office. Building amenities include fitness center, rooftop terrace with city views, and bike storage. Located in trendy Williamsburg with easy subway access to Manhattan, surrounded by artisanal coffee shops, galleries, and Brooklyn's famous food scene.",
+        "property_type": PropertyType.CONDO,
+        "price": 895000,
+        "bedrooms": 2,
+        "bathrooms": 2.0,
+        "square_feet": 1350,
+        "city": "Brooklyn",
+        "state": "NY",
+        "neighborhood": "Williamsburg",
+        "year_built": 2016,
+        "amenities": (Amenity.GYM, Amenity.DISHWASHER, Amenity.HARDWOOD_FLOORS),
+        "listing_agent": "Alex Rivera"
+    },
+    {
+        "title": "Family Home with Pool in Phoenix",
+        "description": "Spacious four-bedroom, three-bathroom single-family home with resort-style backyard oasis. This well-maintained property features tile flooring throughout for easy maintenance in the desert climate, updated kitchen with granite countertops and energy-efficient appliances. The open floor plan connects kitchen, dining, and living areas perfect for family gatherings. Central air conditioning ensures comfort during Arizona's warm months. The master suite includes walk-in closet and private bathroom with dual sinks. Three additional bedrooms provide flexibility for children, guests, or home office space. The highlight is the backyard featuring sparkling swimming pool, covered patio for outdoor dining, and low-maintenance desert landscaping. Two-car garage provides covered parking and storage.",
+        "property_type": PropertyType.HOUSE,
+        "price": 425000,
+        "bedrooms": 4,
+        "bathrooms": 3.0,
+        "square_feet": 2400,
+        "city": "Phoenix",
+        "state": "AZ",
+        "neighborhood": "Ahwatukee",
+        "year_built": 2010,
+        "amenities": (Amenity.POOL, Amenity.AIR_CONDITIONING, Amenity.PARKING),
+        "listing_agent": "Carlos Mendoza"
+    },
+    {
+        "title": "Historic Brownstone in Boston",
+        "description": "Magnificent three-bedroom, two-bathroom brownstone showcasing classic Boston architecture with modern conveniences. This meticulously maintained property features original hardwood floors, high ceilings with decorative moldings, and working fireplace with original mantle. The updated kitchen preserves period charm while incorporating contemporary appliances and functionality. Spacious living and dining rooms maintain historic character with bay windows and original architectural details. The master bedroom offers generous space and period fixtures. Two additional bedrooms provide comfortable accommodations with good natural light. Private basement level includes laundry facilities with washer and dryer. Located on a tree-lined street in prestigious Back Bay neighborhood within walking distance of public transportation, Boston Common, and the city's finest cultural attractions.",
+        "property_type": PropertyType.TOWNHOUSE,
+        "price": 1150000,
+        "bedrooms": 3,
+        "bathrooms": 2.0,
+        "square_feet": 1900,
+        "city": "Boston",
+        "state": "MA",
+        "neighborhood": "Back Bay",
+        "year_built": 1890,
+        "amenities": (Amenity.FIREPLACE, Amenity.HARDWOOD_FLOORS, Amenity.WASHER_DRYER),
+        "listing_agent": "Patricia O'Brien"
+    },
+    {
+        "title": "Modern Apartment with City Views in Seattle",
+        "description": "Contemporary one-bedroom, one-bathroom apartment on the 15th floor with spectacular views of Seattle's skyline and Mount Rainier. This sleek unit features floor-to-ceiling windows, modern kitchen with quartz countertops and stainless steel appliances, and in-unit washer and dryer for convenience. The open living area maximizes space and light with clean lines and neutral finishes. The bedroom comfortably accommodates a king bed with built-in closet storage. Modern bathroom includes walk-in shower with glass enclosure. Building amenities feature rooftop terrace, fitness center, and secure parking. Pet-friendly policy welcomes furry companions. Located in trendy Capitol Hill with easy access to public transportation, Pike Place Market, and Seattle's thriving tech corridor. Walking distance to coffee shops, restaurants, and cultural venues.",
+        "property_type": PropertyType.APARTMENT,
+        "price": 385000,
+        "bedrooms": 1,
+        "bathrooms": 1.0,
+        "square_feet": 750,
+        "city": "Seattle",
+        "state": "WA",
+        "neighborhood": "Capitol Hill",
+        "year_built": 2019,
+        "amenities": (Amenity.PET_FRIENDLY, Amenity.WASHER_DRYER, Amenity.GYM, Amenity.PARKING),
+        "listing_agent": "Jessica Wong"
+    }
+)
+
+
+def iter_sample_properties(seed: Optional[int] = 0) -> Iterator[PropertyListing]:
+    """Lazily yield sample property listings one at a time.
+    
+    Args:
+        seed: RNG seed for `days_on_market`; None draws fresh values each run
+    """
+    
+    rng = np.random.default_rng(seed)
+    days_on_market = rng.integers(1, 61, size=len(_SAMPLE_DATA)).tolist()  # 1..60 inclusive
+    
+    # Create PropertyListing objects; sample data is authored in this module, so skip validation
+    for i, data in enumerate(_SAMPLE_DATA):
+        yield PropertyListing.from_trusted({
+            "title": data["title"],
+            "description": data["description"],
+            "metadata": {
+                "property_id": f"PROP_{i+1:03d}",
+                "property_type": data["property_type"],
+                "status": PropertyStatus.ACTIVE,
+                "price": data["price"],
+                "bedrooms": data["bedrooms"],
+                "bathrooms": data["bathrooms"],
+                "square_feet": data["square_feet"],
+                "city": data["city"],
+                "state": data["state"],
+                "neighborhood": data["neighborhood"],
+                "year_built": data["year_built"],
+                "amenities": list(data["amenities"]),
+                "days_on_market": days_on_market[i],
+                "listing_agent": data["listing_agent"]
+            }
+        })
+
+
+def create_sample_properties(seed: Optional[int] = 0) -> List[PropertyListing]:
+    """Create expanded sample property data for testing (12 properties)."""
+    return list(iter_sample_properties(seed))
+
+
+def ingest_sample_data(
+    properties: Iterable[PropertyListing],
+    batch_size: int = 100,
+    pool_threads: int = 30
+) -> Dict[str, int]:
+    """Ingest sample property data into a fresh Pinecone namespace and switch reads to it."""
+    from .pinecone_client import get_pinecone_client  # Deferred: pulls in the Pinecone/OpenAI SDKs
+    pinecone_client = get_pinecone_client()
+    
+    # Ingest into a fresh namespace; readers switch over only once the upload succeeded.
+    # The uuid suffix keeps two ingests started in the same second apart.
+    namespace = f"ingest_{datetime.now().strftime('%Y%m%d%H%M%S')}_{uuid.uuid4().hex[:8]}"
+    
+    logger.info(f"Uploading sample properties to Pinecone namespace '{namespace}'")
+    result = pinecone_client.upsert_properties_parallel(
+        properties, batch_size=batch_size, pool_threads=pool_threads, namespace=namespace
+    )
+    
+    if result['successful'] and not result['failed']:
+        # Old namespace is deleted in the background instead of blocking the ingest
+        pinecone_client.activate_namespace(namespace)
+    else:
+        logger.warning(f"Upload incomplete, keeping namespace '{pinecone_client.active_namespace}'")
+        pinecone_client.delete_namespace(namespace)
+    
+    return result
+
+
+def save_sample_data_json(ndjson: bool = False) -> Path:
+    """Save sample data to JSON (or NDJSON) for reference, straight from `_SAMPLE_DATA`.
+    
+    No Pydantic models are built here; only the ingest path needs them.
+    Returns the path written.
+    """
+    path = DATA_DIR / ("sample_properties.ndjson" if ndjson else "sample_properties.json")
+    
+    with open(path, "wb", buffering=1024 * 1024) as f:
+        if ndjson:
+            for record in _sample_records():
+                f.write(_dumps(record, indent=False) + b"\n")
+        else:
+            f.write(b"[\n")
+            for i, record in enumerate(_sample_records()):
+                if i:
+                    f.write(b",\n")
+                f.write(_dumps(record))
+            f.write(b"\n]\n")
+    
+    return path
+
+
+def _sample_records() -> Iterator[dict]:
+    """Project `_SAMPLE_DATA` into the plain dicts written to the sample data file."""
+    for i, data in enumerate(_SAMPLE_DATA):
+        yield {
+            "property_id": f"PROP_{i+1:03d}",
+            "title": data["title"],
+            "description": data["description"],
+            "price": data["price"],
+            "bedrooms": data["bedrooms"],
+            "bathrooms": data["bathrooms"],
+            "square_feet": data["square_feet"],
+            "property_type": _PTYPE_VALUE[data["property_type"]],
+            "city": data["city"],
+            "state": data["state"],
+            "neighborhood": data["neighborhood"],
+            "amenities": [_AMENITY_VALUE[a] for a in data["amenities"]],
+            "listing_agent": data["listing_agent"],
+            "year_built": data["year_built"]
+        }
+
+
+def main(argv: Optional[List[str]] = None, description: Optional[str] = None):
+    """Command-line entry point shared by the scripts/ and examples/ ingestion wrappers."""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--batch-size", type=int, default=100,
+                        help="Vectors per Pinecone upsert request (default: 100)")
+    parser.add_argument("--pool-threads", type=int, default=30,
+                        help="Concurrent upsert requests (default: 30)")
+    parser.add_argument("--ndjson", action="store_true",
+                        help="Write line-delimited JSON instead of an indented array")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="Seed for generated listing fields (default: 0)")
+    args = parser.parse_args(argv)
+    
+    print(f"Sample data saved to {save_sample_data_json(ndjson=args.ndjson)}")
+    
+    print("Uploading to Pinecone with description vectorization...")
+    result = ingest_sample_data(iter_sample_properties(seed=args.seed), batch_size=args.batch_size, pool_threads=args.pool_threads)
+    print("Data ingestion completed!")
+    print(f"   - Total properties: {result['total']}")
+    print(f"   - Successfully uploaded: {result['successful']}")
+    print(f"   - Failed: {result['failed']}")
+
+
+def _dumps(obj, indent: bool = True) -> bytes:
+    """Serialize to JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2) if indent else orjson.dumps(obj)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
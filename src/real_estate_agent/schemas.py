@@ -1,9 +1,13 @@
 """Data models and schemas for real estate properties (MVP version)."""
 
+import sys
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from functools import cached_property
+from typing import Annotated, List, Optional, Dict, Any, Iterable
 from enum import Enum
-from pydantic import BaseModel, Field, validator
+from pydantic import (
+    BaseModel, ConfigDict, Field, StringConstraints, ValidationInfo, field_validator
+)
 
 
 class PropertyType(str, Enum):
@@ -34,11 +38,40 @@ class Amenity(str, Enum):
     WASHER_DRYER = "washer_dryer"
     AIR_CONDITIONING = "air_conditioning"
     HARDWOOD_FLOORS = "hardwood_floors"
+    
+    @property
+    def bit(self) -> int:
+        """Single-bit flag for this amenity in an amenity bitmask."""
+        return _AMENITY_BIT[self]
+
+
+# Bit i is the i-th Amenity member; fits a uint32 while there are at most 32 amenities
+_AMENITY_BIT = {a: 1 << i for i, a in enumerate(Amenity)}
+
+
+def amenity_mask(amenities: Iterable[Amenity]) -> int:
+    """Pack amenities into a bitmask, so "has all of" becomes `mask & required == required`."""
+    mask = 0
+    for amenity in amenities:
+        mask |= _AMENITY_BIT[amenity]
+    return mask
+
+
+# Plain dict lookups instead of enum `.value` descriptor access per serialized listing
+_AMENITY_VALUE = {a: a.value for a in Amenity}
+_PTYPE_VALUE = {p: p.value for p in PropertyType}
+_STATUS_VALUE = {s: s.value for s in PropertyStatus}
+
+# Low-cardinality metadata strings interned on both the validated and trusted construction paths
+_INTERNED_FIELDS = ('state', 'city', 'neighborhood', 'listing_agent')
 
 
 class PropertyMetadata(BaseModel):
     """Simple metadata for property filtering and search (MVP)."""
     
+    # Immutable value object; pydantic v2 has no slots option, fields stay in __dict__
+    model_config = ConfigDict(frozen=True)
+    
     # Identification
     property_id: str = Field(..., description="Unique property identifier")
     
@@ -52,7 +85,7 @@ class PropertyMetadata(BaseModel):
     
     # Location (simplified)
     city: str = Field(..., description="City")
-    state: str = Field(..., max_length=2, description="State abbreviation (e.g., 'NY')")
+    state: Annotated[str, StringConstraints(max_length=2, to_upper=True)] = Field(..., description="State abbreviation (e.g., 'NY')")
     neighborhood: Optional[str] = Field(None, description="Neighborhood name")
     
     # Property Details
@@ -65,20 +98,28 @@ class PropertyMetadata(BaseModel):
     days_on_market: int = Field(default=0, ge=0, description="Number of days on market")
     listing_agent: str = Field(..., description="Name of listing agent")
     
-    @validator('state')
-    def validate_state(cls, v):
-        """Ensure state is uppercase."""
-        return v.upper() if v else v
+    @field_validator(*_INTERNED_FIELDS)
+    @classmethod
+    def intern_low_cardinality(cls, v):
+        """Intern state/location/agent names, which repeat across listings, so each is stored once."""
+        return sys.intern(v) if v else v
     
-    @property
+    @cached_property
+    def amenities_mask(self) -> int:
+        """Amenities packed with `amenity_mask` (once; the model is frozen)."""
+        return amenity_mask(self.amenities)
+    
+    @cached_property
     def price_per_sqft(self) -> float:
-        """Calculate price per square foot."""
+        """Calculate price per square foot (once; the model is frozen)."""
         return self.price / self.square_feet if self.square_feet > 0 else 0
 
 
 class PropertyListing(BaseModel):
     """Complete property listing with description and metadata (MVP)."""
     
+    model_config = ConfigDict(frozen=True)
+    
     # Core content for semantic search - ONLY description will be vectorized
     title: str = Field(..., description="Property listing title")
     description: str = Field(..., description="Detailed property description for vectorization")
@@ -89,39 +130,74 @@ class PropertyListing(BaseModel):
     # System fields
     created_at: datetime = Field(default_factory=datetime.utcnow, description="Record creation timestamp")
     
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "PropertyListing":
+        """Build a listing from data we authored or already validated, skipping validation."""
+        fields = dict(data)
+        metadata = fields.pop("metadata")
+        if not isinstance(metadata, PropertyMetadata):
+            # model_construct skips validators, so intern here as intern_low_cardinality would
+            metadata = {
+                key: sys.intern(value) if key in _INTERNED_FIELDS and isinstance(value, str) else value
+                for key, value in metadata.items()
+            }
+            metadata = PropertyMetadata.model_construct(**metadata)
+        return cls.model_construct(metadata=metadata, **fields)
+    
+    @classmethod
+    def from_user_input(cls, data: Dict[str, Any]) -> "PropertyListing":
+        """Build a listing from untrusted input with full validation."""
+        return cls.model_validate(data)
+    
     def to_dict_for_pinecone(self) -> dict:
         """Convert to dictionary format suitable for Pinecone."""
         return {
             "id": self.metadata.property_id,
             "values": [],  # Will be populated with embeddings from description only
-            "metadata": {
-                # Core searchable fields - only description is vectorized
-                "property_id": self.metadata.property_id,  # CRITICAL: Add property_id to metadata
-                "title": self.title,
-                "description": self.description,  # This is what gets vectorized
-                
-                # Filterable metadata
-                "property_type": self.metadata.property_type.value,
-                "status": self.metadata.status.value,
-                "price": self.metadata.price,
-                "bedrooms": self.metadata.bedrooms,
-                "bathrooms": self.metadata.bathrooms,
-                "square_feet": self.metadata.square_feet,
-                "city": self.metadata.city,
-                "state": self.metadata.state,
-                "neighborhood": self.metadata.neighborhood,
-                "year_built": self.metadata.year_built,
-                "days_on_market": self.metadata.days_on_market,
-                "amenities": [amenity.value for amenity in self.metadata.amenities],
-                "listing_agent": self.metadata.listing_agent,
-                
-                # Calculated fields
-                "price_per_sqft": self.metadata.price_per_sqft,
-                
-                # System fields
-                "created_at": self.created_at.isoformat(),
-            }
+            "metadata": self.pinecone_metadata()
+        }
+    
+    def pinecone_metadata(self) -> dict:
+        """
+        Build only the Pinecone metadata dict; upserts pair it with the id and vector directly.
+        
+        Unset optional fields are left out rather than sent as nulls, which Pinecone rejects anyway.
+        """
+        metadata = self.metadata
+        fields = {
+            # Core searchable fields - only description is vectorized
+            "property_id": metadata.property_id,  # CRITICAL: Add property_id to metadata
+            "title": self.title,
+            "description": self.description,  # This is what gets vectorized
+            
+            # Filterable metadata
+            "property_type": _PTYPE_VALUE[metadata.property_type],
+            "status": _STATUS_VALUE[metadata.status],
+            "price": metadata.price,
+            "bedrooms": metadata.bedrooms,
+            "bathrooms": metadata.bathrooms,
+            "square_feet": metadata.square_feet,
+            "city": metadata.city,
+            "state": metadata.state,
+            "days_on_market": metadata.days_on_market,
+            "listing_agent": metadata.listing_agent,
+            
+            # Calculated fields
+            "price_per_sqft": metadata.price_per_sqft,
+            
+            # System fields
+            "created_at": self.created_at.isoformat(),
         }
+        
+        # Optional fields
+        if metadata.neighborhood is not None:
+            fields["neighborhood"] = metadata.neighborhood
+        if metadata.year_built is not None:
+            fields["year_built"] = metadata.year_built
+        if metadata.amenities:
+            fields["amenities"] = [_AMENITY_VALUE[amenity] for amenity in metadata.amenities]
+        
+        return fields
 
 
 class SearchQuery(BaseModel):
@@ -145,10 +221,16 @@ class SearchQuery(BaseModel):
     min_bathrooms: Optional[float] = Field(None, ge=0, description="Minimum bathrooms")
     required_amenities: List[Amenity] = Field(default_factory=list, description="Required amenities")
     
-    @validator('max_price')
-    def validate_price_range(cls, v, values):
+    @property
+    def required_amenities_mask(self) -> int:
+        """Required amenities packed with `amenity_mask`."""
+        return amenity_mask(self.required_amenities)
+    
+    @field_validator('max_price')
+    @classmethod
+    def validate_price_range(cls, v, info: ValidationInfo):
         """Ensure max_price is greater than min_price if both are provided."""
-        min_price = values.get('min_price')
+        min_price = info.data.get('min_price')
         if min_price is not None and v is not None and v <= min_price:
             raise ValueError('max_price must be greater than min_price')
         return v
\ No newline at end of file
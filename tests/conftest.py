@@ -0,0 +1,24 @@
+"""Shared pytest fixtures; nothing here talks to OpenAI or Pinecone."""
+
+import os
+import sys
+
+# Settings require API keys at import time; tests never send them anywhere
+os.environ.setdefault("OPENAI_API_KEY", "test-openai-key")
+os.environ.setdefault("PINECONE_API_KEY", "test-pinecone-key")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from src.real_estate_agent import pinecone_client as pinecone_client_module
+from src.real_estate_agent.pinecone_client import PineconeClient
+
+
+@pytest.fixture
+def pinecone_client(monkeypatch, tmp_path):
+    """A PineconeClient built with the real SDK objects but without any network setup calls."""
+    monkeypatch.setattr(pinecone_client_module.settings, "pinecone_namespace_file", tmp_path / ".active_namespace")
+    monkeypatch.setattr(PineconeClient, "_setup_index", lambda self: None)
+    monkeypatch.setattr(PineconeClient, "_setup_vector_store", lambda self: None)
+    return PineconeClient()
@@ -0,0 +1,70 @@
+"""Tests for PropertyCatalog's numeric columns and filtering."""
+
+import pytest
+
+from src.real_estate_agent.catalog import PropertyCatalog
+from src.real_estate_agent.schemas import Amenity, PropertyListing, SearchQuery
+
+
+def _listing(property_id: str, **metadata) -> PropertyListing:
+    return PropertyListing.from_user_input({
+        "title": f"Listing {property_id}",
+        "description": "Test listing",
+        "metadata": {
+            "property_id": property_id,
+            "property_type": "house",
+            "price": 500000,
+            "bedrooms": 3,
+            "bathrooms": 2.0,
+            "square_feet": 1800,
+            "city": "Austin",
+            "state": "TX",
+            "listing_agent": "Test Agent",
+            **metadata
+        }
+    })
+
+
+def _selected_ids(catalog: PropertyCatalog, **query) -> list:
+    return [listing.metadata.property_id for listing in catalog.select(SearchQuery(query="test", **query))]
+
+
+def test_quarter_baths_are_kept_exactly():
+    catalog = PropertyCatalog([
+        _listing("PROP_A", bathrooms=1.75),
+        _listing("PROP_B", bathrooms=2.0),
+        _listing("PROP_C", bathrooms=1.5)
+    ])
+
+    assert catalog.bathrooms.tolist() == [1.75, 2.0, 1.5]
+    assert _selected_ids(catalog, min_bathrooms=1.75) == ["PROP_A", "PROP_B"]
+    assert _selected_ids(catalog, min_bathrooms=1.8) == ["PROP_B"]
+
+
+def test_numeric_and_amenity_filters():
+    catalog = PropertyCatalog([
+        _listing("PROP_A", price=300000, bedrooms=2, amenities=["pool"]),
+        _listing("PROP_B", price=650000, bedrooms=4, amenities=["pool", "gym"]),
+        _listing("PROP_C", price=900000, bedrooms=5, amenities=["gym"])
+    ])
+
+    assert _selected_ids(catalog, max_price=700000, min_bedrooms=3) == ["PROP_B"]
+    assert _selected_ids(catalog, required_amenities=[Amenity.GYM]) == ["PROP_B", "PROP_C"]
+    assert _selected_ids(catalog, required_amenities=[Amenity.POOL, Amenity.GYM]) == ["PROP_B"]
+
+
+@pytest.mark.parametrize("field, value", [
+    ("bedrooms", 200),
+    ("price", 3_000_000_000),
+    ("square_feet", 2**31)
+])
+def test_values_outside_the_column_dtype_are_rejected(field, value):
+    with pytest.raises(ValueError, match=field):
+        PropertyCatalog([_listing("PROP_A", **{field: value})])
+
+
+def test_empty_catalog():
+    catalog = PropertyCatalog([])
+
+    assert len(catalog) == 0
+    assert _selected_ids(catalog, min_bathrooms=1.0) == []
@@ -0,0 +1,129 @@
+"""Tests for the evaluation pipeline's parsing, judge cache and batch judge mapping."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from evaluation.batch_evaluator import BATCH_ENDPOINT, BatchJudgeRunner
+from evaluation.evaluator import PropertyMatchEvaluator
+from evaluation.judge_cache import JudgeCache
+from evaluation.performance_pipeline import PerformancePipeline
+from src.real_estate_agent.sample_data import create_sample_properties
+
+_AGENT_RESPONSE = """Here are the best matches:
+
+- Luxury Waterfront Condo in Miami Beach (South Beach, Miami Beach, FL) — $750,000
+  2 bed | 2 bath | 1,200 sq ft | Condo | 2018 | $708/sq ft | 12 days on market
+  Ocean views and a pool.
+- Corner Loft (Downtown, Austin, TX) — $1,250,000.50 (price reduced)
+- Modern Family House in Austin (Westlake, Austin, TX) — $650,000
+  4 bed | 3.5 bath | 2,400 sq ft | House | 2015 | $271/sq ft | 30 days on market
+"""
+
+
+@pytest.fixture
+def pipeline():
+    """A pipeline with only the sample-data lookups the parser needs (no clients)."""
+    pipeline = PerformancePipeline.__new__(PerformancePipeline)
+    pipeline._by_tcp = {
+        (p.title.lower(), p.metadata.city.lower(), p.metadata.price): p.metadata.property_id
+        for p in create_sample_properties()
+    }
+    return pipeline
+
+
+def test_agent_response_blocks_are_parsed(pipeline):
+    miami, loft, austin = pipeline._parse_agent_response(_AGENT_RESPONSE)
+
+    assert miami == {
+        "title": "Luxury Waterfront Condo in Miami Beach",
+        "city": "Miami Beach",
+        "state": "FL",
+        "neighborhood": "South Beach",
+        "price": 750000,
+        "bedrooms": 2,
+        "bathrooms": 2.0,
+        "property_type": "condo",
+        "property_id": "PROP_001"  # Matched to the sample listing by title, city and price
+    }
+    # A block without a details line keeps only the title-line fields
+    assert loft == {
+        "title": "Corner Loft",
+        "city": "Austin",
+        "state": "TX",
+        "neighborhood": "Downtown",
+        "price": 1250000,
+        "property_id": "UNKNOWN"
+    }
+    assert (austin["bedrooms"], austin["bathrooms"], austin["property_type"]) == (4, 3.5, "house")
+
+
+def test_agent_response_without_blocks_parses_to_nothing(pipeline):
+    assert pipeline._parse_agent_response("No properties found") == []
+
+
+def test_judge_cache_round_trip(tmp_path):
+    messages = [{"role": "user", "content": "Judge these results"}]
+    key = JudgeCache.make_key("gpt-4o", messages)
+
+    with JudgeCache(str(tmp_path / "judge_cache")) as cache:
+        assert cache.get(key) is None
+        cache.set(key, {"accuracy": 0.8, "is_correct": True})
+
+    with JudgeCache(str(tmp_path / "judge_cache")) as cache:
+        assert cache.get(key) == {"accuracy": 0.8, "is_correct": True}
+        assert cache.get(JudgeCache.make_key("gpt-4o-mini", messages)) is None
+        assert cache.stats == {"hits": 1, "misses": 1}
+        assert cache.hit_rate == 0.5
+
+
+class FakeBatchClient:
+    """Records the uploaded batch file and serves a canned output file."""
+
+    def __init__(self, output_lines):
+        self.uploaded = None
+        self.output = "\n".join(json.dumps(line) for line in output_lines)
+        self.files = SimpleNamespace(create=self._create_file, content=self._file_content)
+        self.batches = SimpleNamespace(create=lambda **kwargs: SimpleNamespace(id="batch_1", **kwargs))
+
+    def _create_file(self, file, purpose):
+        name, payload = file
+        self.uploaded = [json.loads(line) for line in payload.getvalue().decode("utf-8").splitlines()]
+        return SimpleNamespace(id="file_in")
+
+    def _file_content(self, file_id):
+        return SimpleNamespace(text=self.output)
+
+
+def _judge_output(custom_id, content):
+    return {
+        "custom_id": custom_id,
+        "response": {"status_code": 200, "body": {"choices": [{"message": {"content": content}}]}}
+    }
+
+
+def test_batch_requests_and_responses_map_by_custom_id():
+    client = FakeBatchClient([
+        _judge_output("B|1", "ACCURACY: 0.5\nIS_CORRECT: false\nREASONING: Missing one"),
+        _judge_output("A|0", "ACCURACY: 1.0\nIS_CORRECT: true\nREASONING: All found"),
+        {"custom_id": "C|2", "response": {"status_code": 429, "body": {"error": "rate limited"}}}
+    ])
+    evaluator = PropertyMatchEvaluator(model="gpt-4o", client=object(), sync_client=client)
+    runner = BatchJudgeRunner(evaluator, client=client)
+    prompts = {
+        "A|0": [{"role": "user", "content": "first"}],
+        "B|1": [{"role": "user", "content": "second"}]
+    }
+
+    assert runner.submit_batch(prompts) == "batch_1"
+    assert [(r["custom_id"], r["url"], r["body"]["model"], r["body"]["messages"]) for r in client.uploaded] == [
+        ("A|0", BATCH_ENDPOINT, "gpt-4o", prompts["A|0"]),
+        ("B|1", BATCH_ENDPOINT, "gpt-4o", prompts["B|1"])
+    ]
+
+    results = runner.collect_results(SimpleNamespace(output_file_id="file_out"))
+
+    assert (results["A|0"]["accuracy"], results["A|0"]["is_correct"]) == (1.0, True)
+    assert (results["B|1"]["accuracy"], results["B|1"]["reasoning"]) == (0.5, "Missing one")
+    assert results["C|2"] == {"accuracy": 0.0, "is_correct": False, "error": "rate limited"}
@@ -0,0 +1,40 @@
+"""Tests for Pinecone metadata filter building and its memoization."""
+
+from src.real_estate_agent.pinecone_client import _build_filter
+
+
+def test_filter_conditions_skip_empty_values_and_keep_zero_bounds(pinecone_client):
+    metadata_filter = pinecone_client.build_metadata_filter(
+        city="Miami", neighborhood="", min_price=0, required_amenities=["pool", "gym"]
+    )
+
+    assert metadata_filter == {"$and": [
+        {"city": {"$eq": "Miami"}},
+        {"price": {"$gte": 0}},
+        {"amenities": {"$in": ["pool"]}},
+        {"amenities": {"$in": ["gym"]}},
+        {"status": {"$eq": "active"}}
+    ]}
+
+
+def test_status_only_filter_is_not_wrapped(pinecone_client):
+    assert pinecone_client.build_metadata_filter() == {"status": {"$eq": "active"}}
+
+
+def test_list_valued_amenities_hit_the_filter_cache(pinecone_client):
+    _build_filter.cache_clear()
+
+    first = pinecone_client.build_metadata_filter(required_amenities=["pool"], max_price=500000)
+    second = pinecone_client.build_metadata_filter(max_price=500000, required_amenities=["pool"])
+
+    assert second is first
+    assert _build_filter.cache_info().hits == 1
+
+
+def test_unhashable_filter_values_bypass_the_cache(pinecone_client):
+    _build_filter.cache_clear()
+
+    metadata_filter = pinecone_client.build_metadata_filter(city={"name": "Miami"})
+
+    assert metadata_filter["$and"][0] == {"city": {"$eq": {"name": "Miami"}}}
+    assert _build_filter.cache_info().currsize == 0
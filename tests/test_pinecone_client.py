@@ -0,0 +1,134 @@
+"""Tests for PineconeClient index setup and its query embedding cache."""
+
+import asyncio
+import hashlib
+from types import SimpleNamespace
+
+import numpy as np
+from pinecone import Pinecone
+
+from src.real_estate_agent.config import settings
+from src.real_estate_agent.pinecone_client import PineconeClient, _CONNECTION_POOL_MAXSIZE
+
+# Captured before the client fixture stubs it out
+_setup_index = PineconeClient._setup_index
+
+
+class FakeEmbeddings:
+    """Deterministic embeddings with full float precision; counts embedding requests."""
+
+    def __init__(self, dimension: int = 64):
+        self.dimension = dimension
+        self.calls = 0
+
+    def embed_documents(self, texts):
+        self.calls += 1
+        return [self._embed(text) for text in texts]
+
+    def _embed(self, text):
+        seed = int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "little")
+        vector = np.random.default_rng(seed).standard_normal(self.dimension)
+        return (vector / np.linalg.norm(vector)).tolist()
+
+
+class FakeIndex:
+    """Scores a fixed document set by dot product, so ranking depends on the exact query vector."""
+
+    def __init__(self, dimension: int = 64, documents: int = 50):
+        self.documents = np.random.default_rng(7).standard_normal((documents, dimension))
+        self.query_vectors = []
+
+    def query(self, vector, top_k, filter, namespace, include_metadata):
+        self.query_vectors.append(vector)
+        scores = self.documents @ np.asarray(vector, dtype=np.float64)
+        return SimpleNamespace(matches=[
+            SimpleNamespace(metadata={"property_id": f"PROP_{i:03d}"}, score=float(scores[i]))
+            for i in np.argsort(-scores)[:top_k]
+        ])
+
+
+def test_embedding_cache_hit_matches_miss(pinecone_client):
+    pinecone_client.embeddings = FakeEmbeddings()
+    pinecone_client.index = FakeIndex()
+
+    miss = pinecone_client.search_properties("Condo in Miami with a pool", top_k=10)
+    hit = pinecone_client.search_properties("  condo in miami with a pool ", top_k=10)
+
+    assert pinecone_client.embeddings.calls == 1
+    assert pinecone_client.embedding_cache_stats == {"hits": 1, "misses": 1}
+    assert pinecone_client.index.query_vectors[0] == pinecone_client.index.query_vectors[1]
+    assert hit == miss
+
+
+def test_embedding_cache_batch_hit_matches_miss(pinecone_client):
+    pinecone_client.embeddings = FakeEmbeddings()
+    queries = ["Studio in Manhattan", "House in Austin", "Studio in Manhattan"]
+
+    first = pinecone_client.embed_queries(queries)
+    second = pinecone_client.embed_queries(queries)
+
+    assert pinecone_client.embeddings.calls == 1
+    assert first == second
+    assert first[0] == first[2]
+    np.testing.assert_allclose(first[1], FakeEmbeddings()._embed("house in austin"), rtol=1e-6)
+
+
+def test_setup_index_builds_pooled_index_handle(pinecone_client, monkeypatch):
+    host = "real-estate-properties-abc1234.svc.aped-4627-b74a.pinecone.io"
+    description = SimpleNamespace(
+        name=settings.pinecone_index_name,
+        dimension=settings.embedding_dimension,
+        metric=settings.pinecone_metric,
+        host=host
+    )
+    monkeypatch.setattr(Pinecone, "list_indexes", lambda self: [description])
+    monkeypatch.setattr(Pinecone, "describe_index", lambda self, name: description)
+    monkeypatch.setattr(PineconeClient, "get_index_stats", lambda self, force_refresh=False: {})
+
+    _setup_index(pinecone_client)
+
+    assert pinecone_client.index_host == host
+    assert pinecone_client.index._openapi_config.connection_pool_maxsize == _CONNECTION_POOL_MAXSIZE
+
+
+class RecordingIndex:
+    """Records namespace deletions."""
+
+    def __init__(self):
+        self.deleted = []
+
+    def delete(self, delete_all, namespace):
+        self.deleted.append(namespace)
+
+
+def test_activate_namespace_retires_only_a_different_named_namespace(pinecone_client):
+    pinecone_client.index = RecordingIndex()
+
+    assert pinecone_client.activate_namespace("ingest_a") is None  # Default namespace is kept
+    assert pinecone_client.active_namespace == "ingest_a"
+
+    assert pinecone_client.activate_namespace("ingest_a") is None  # Re-activation deletes nothing
+    assert pinecone_client.index.deleted == []
+
+    pinecone_client.activate_namespace("ingest_b").join()
+    assert pinecone_client.active_namespace == "ingest_b"
+    assert pinecone_client.index.deleted == ["ingest_a"]
+
+
+def test_async_index_is_reused_per_event_loop_and_closed(pinecone_client):
+    pinecone_client.index_host = "real-estate-properties-abc1234.svc.aped-4627-b74a.pinecone.io"
+
+    async def open_handles():
+        handles = [pinecone_client._get_async_index(), pinecone_client._get_async_index()]
+        await pinecone_client.aclose()
+        handles.append(pinecone_client._get_async_index())  # Reopened after aclose
+        await pinecone_client.aclose()
+        return handles
+
+    first, second, reopened = asyncio.run(open_handles())
+    other_loop, _, _ = asyncio.run(open_handles())
+
+    assert first is second
+    assert reopened is not first
+    assert other_loop is not first
+    assert not pinecone_client._async_indexes
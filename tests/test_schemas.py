@@ -0,0 +1,27 @@
+"""Tests for PropertyListing construction paths."""
+
+from src.real_estate_agent.schemas import PropertyListing
+
+_DATA = {
+    "title": "Listing PROP_A",
+    "description": "Test listing",
+    "metadata": {
+        "property_id": "PROP_A",
+        "property_type": "house",
+        "price": 500000,
+        "bedrooms": 3,
+        "bathrooms": 2.0,
+        "square_feet": 1800,
+        "city": "Austin",
+        "state": "TX",
+        "listing_agent": "Test Agent"
+    }
+}
+
+
+def test_trusted_and_validated_listings_share_interned_strings():
+    city = "".join(["Aus", "tin"])  # Built at runtime, so not already interned
+    trusted = PropertyListing.from_trusted({**_DATA, "metadata": {**_DATA["metadata"], "city": city}})
+    validated = PropertyListing.from_user_input(_DATA)
+
+    assert trusted.metadata.city is validated.metadata.city